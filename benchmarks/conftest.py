@@ -0,0 +1,188 @@
+"""Shared fixtures for the performance benchmark suite.
+
+The benchmarks use `pytest-benchmark`. Store a baseline once and compare later
+runs against it to catch regressions in the document pipelines:
+
+    python -m pytest benchmarks --benchmark-only --benchmark-save=baseline
+    python -m pytest benchmarks --benchmark-only --benchmark-compare \
+        --benchmark-compare-fail=mean:15%
+
+Baselines are written to `.benchmarks/` in the repository root.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+PDF_PAGES = 300
+PDF_LINES_PER_PAGE = 40
+
+
+# Synthetic PDF generation
+def _escape_pdf_text(text: str) -> str:
+    """Escapes characters with special meaning in PDF string literals."""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_synthetic_pdf(
+    path: str, num_pages: int, lines_per_page: int = PDF_LINES_PER_PAGE
+) -> str:
+    """
+    Writes a minimal, valid PDF file with text content on every page.
+
+    Args:
+        path (str): Output path of the PDF file.
+        num_pages (int): Number of pages to generate.
+        lines_per_page (int, optional): Number of text lines per page.
+
+    Returns:
+        str: The path of the written PDF file.
+    """
+    # Object numbering: 1 catalog, 2 pages tree, 3 font, then (page, content) pairs
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    page_ids = []
+    for page_idx in range(num_pages):
+        page_id = 4 + 2 * page_idx
+        content_id = page_id + 1
+        page_ids.append(page_id)
+
+        lines = [
+            f"Page {page_idx + 1} line {line_idx + 1}: Article {page_idx % 50} "
+            "sets out obligations for providers of high-risk AI systems."
+            for line_idx in range(lines_per_page)
+        ]
+        stream = "BT /F1 10 Tf 14 TL 40 800 Td "
+        stream += " ".join(f"({_escape_pdf_text(line)}) Tj T*" for line in lines)
+        stream += " ET"
+        stream_bytes = stream.encode("latin-1")
+
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode("latin-1")
+        objects[content_id] = (
+            f"<< /Length {len(stream_bytes)} >>\nstream\n".encode("latin-1")
+            + stream_bytes
+            + b"\nendstream"
+        )
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[2] = f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>".encode(
+        "latin-1"
+    )
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(output)
+        output += f"{obj_id} 0 obj\n".encode("latin-1")
+        output += objects[obj_id]
+        output += b"\nendobj\n"
+
+    xref_offset = len(output)
+    size = max(objects) + 1
+    output += f"xref\n0 {size}\n".encode("latin-1")
+    output += b"0000000000 65535 f \n"
+    for obj_id in range(1, size):
+        output += f"{offsets[obj_id]:010d} 00000 n \n".encode("latin-1")
+    output += (
+        f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n"
+    ).encode("latin-1")
+
+    with open(path, "wb") as file:
+        file.write(output)
+    return path
+
+
+@pytest.fixture(scope="session")
+def large_pdf(tmp_path_factory):
+    """Path to a synthetic multi-hundred-page PDF file."""
+    path = tmp_path_factory.mktemp("pdf") / "large_document.pdf"
+    return write_synthetic_pdf(str(path), num_pages=PDF_PAGES)
+
+
+@pytest.fixture(scope="session")
+def html_fixture():
+    """Content of the saved HTML article fixture as bytes."""
+    with open(os.path.join(FIXTURES_DIR, "article.html"), "rb") as file:
+        return file.read()
+
+
+# Fake chat backend
+QA_RESPONSE = json.dumps(
+    {
+        str(idx): {
+            "question": f"What does obligation {idx} require from providers?",
+            "answer": "Providers must document, test and monitor their systems.",
+        }
+        for idx in range(3)
+    }
+)
+SUMMARY_RESPONSE = (
+    "## Summary\nThe text sets out obligations for providers of AI systems.\n\n"
+    "- Risk management\n- Documentation\n- Human oversight"
+)
+
+
+class FakeCompletions:
+    """Mimics `chat.completions` of an OpenAI client and answers instantly."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, model, messages, **kwargs):
+        """Returns a canned completion shaped like the OpenAI response object."""
+        self.calls += 1
+        response_format = kwargs.get("response_format") or {}
+        if response_format.get("type") == "json_object":
+            content = QA_RESPONSE
+        else:
+            content = SUMMARY_RESPONSE
+        prompt_tokens = sum(len(message["content"]) for message in messages) // 4
+        return SimpleNamespace(
+            model=model,
+            usage=SimpleNamespace(total_tokens=prompt_tokens + len(content) // 4),
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        )
+
+
+@pytest.fixture
+def fake_chat_backend(monkeypatch):
+    """Routes all Chat API calls of `genaipy.openai_apis.chat` to a fake backend."""
+    chat = pytest.importorskip("genaipy.openai_apis.chat")
+    completions = FakeCompletions()
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(chat, "_client", fake_client)
+    return completions
+
+
+# Script loading
+def load_script(name: str, monkeypatch, argv=None):
+    """
+    Imports a module from the `scripts` folder with a dummy API key and CLI arguments.
+
+    Args:
+        name (str): Module name of the script without the file extension.
+        monkeypatch: The pytest monkeypatch fixture.
+        argv (list, optional): Command line arguments passed to the script.
+
+    Returns:
+        module: The imported script module.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-benchmark")
+    monkeypatch.setattr(sys, "argv", [name] + list(argv or []))
+    path = os.path.join(REPO_ROOT, "scripts", f"{name}.py")
+    spec = importlib.util.spec_from_file_location(f"bench_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,61 @@
+"""Benchmarks for the PDF and web content extractors."""
+
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+requests = pytest.importorskip("requests")
+
+from genaipy.extractors import pdf, web  # pylint: disable=wrong-import-position
+from conftest import PDF_PAGES  # pylint: disable=wrong-import-position
+
+
+def test_extract_pages_text_full_document(benchmark, large_pdf):
+    """Benchmark text extraction of every page of a multi-hundred-page PDF"""
+    pages = benchmark(pdf.extract_pages_text, large_pdf)
+    assert len(pages) == PDF_PAGES
+
+
+def test_extract_pages_text_page_range(benchmark, large_pdf):
+    """Benchmark text extraction of a page range from the middle of a large PDF"""
+    pages = benchmark(pdf.extract_pages_text, large_pdf, start_page=100, end_page=149)
+    assert len(pages) == 50
+    assert pages[1]["page_number"] == 100
+
+
+@pytest.mark.parametrize("engine", list(pdf.ENGINE_MODULES))
+def test_extract_pages_text_engines(benchmark, large_pdf, engine):
+    """Benchmark full-document extraction throughput of every installed PDF engine"""
+    if engine not in pdf.available_engines():
+        pytest.skip(f"PDF engine '{engine}' is not installed")
+    benchmark.group = "pdf-engines"
+    pages = benchmark(pdf.extract_pages_text, large_pdf, engine=engine)
+    assert len(pages) == PDF_PAGES
+    assert pages[1]["page_number"] == 1
+    assert "Page 1 line 1" in pages[1]["content"]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"low_memory": True}, {"low_memory": True, "spill_to_disk": True}],
+    ids=["low_memory", "spill_to_disk"],
+)
+def test_extract_pages_text_memory_modes(benchmark, large_pdf, options):
+    """Benchmark the memory-saving extraction modes against the same output schema"""
+    expected = pdf.extract_pages_text(large_pdf, start_page=1, end_page=20)
+    pages = benchmark(pdf.extract_pages_text, large_pdf, **options)
+    assert len(pages) == PDF_PAGES
+    assert {key: pages[key] for key in expected} == expected
+
+
+def test_extract_tags_contents(benchmark, monkeypatch, html_fixture):
+    """Benchmark HTML parsing of a saved article fixture"""
+
+    def fake_get(url, timeout):  # pylint: disable=unused-argument
+        return SimpleNamespace(content=html_fixture, raise_for_status=lambda: None)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    text = benchmark(
+        web.extract_tags_contents, "https://example.com/article", ["h1", "h2", "p"]
+    )
+    assert "risk management system" in text
@@ -0,0 +1,36 @@
+"""Benchmarks for the import time of genaipy modules in a fresh interpreter."""
+
+import subprocess
+import sys
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from conftest import REPO_ROOT  # pylint: disable=wrong-import-position
+
+MODULES = [
+    "genaipy.prompts.build_prompt",
+    "genaipy.utilities",
+    "genaipy.extractors.pdf",
+    "genaipy.extractors.web",
+    "genaipy.openai_apis.chat",
+]
+
+
+def _import_in_subprocess(module: str) -> None:
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"], cwd=REPO_ROOT, check=True
+    )
+
+
+def test_interpreter_startup(benchmark):
+    """Benchmark a bare interpreter start as reference for the import benchmarks"""
+    benchmark.pedantic(
+        subprocess.run, args=([sys.executable, "-c", "pass"],), rounds=10
+    )
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_time(benchmark, module):
+    """Benchmark interpreter start plus the import of a genaipy module"""
+    benchmark.pedantic(_import_in_subprocess, args=(module,), rounds=10)
@@ -0,0 +1,73 @@
+"""End-to-end benchmarks of the map-reduce and Q&A scripts against a fake chat backend."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("tqdm")
+pytest.importorskip("pandas")
+
+from conftest import (  # pylint: disable=wrong-import-position
+    load_script,
+    write_synthetic_pdf,
+)
+from genaipy.utilities import (  # pylint: disable=wrong-import-position
+    iter_dataset_records,
+)
+
+NUM_PAGES = 100
+
+
+def test_map_reduce_summarizer(benchmark, monkeypatch, large_pdf, fake_chat_backend):
+    """Benchmark a full map-reduce run over a page range of a large PDF"""
+    script = load_script("map_reduce_summarizer", monkeypatch)
+
+    def run():
+        pages = script.process_pdf(large_pdf, 1, NUM_PAGES)
+        map_summaries = script.generate_map_summaries(pages)
+        return script.generate_reduce_summary(map_summaries)
+
+    final_summary = benchmark(run)
+    assert final_summary
+    assert fake_chat_backend.calls % (NUM_PAGES + 1) == 0
+
+
+def test_synthetic_qa_generator(
+    benchmark, monkeypatch, tmp_path, large_pdf, fake_chat_backend
+):
+    """Benchmark a full synthetic Q&A dataset run over a page range of a large PDF"""
+    output_dir = str(tmp_path / "synthetic_dataset")
+    script = load_script(
+        "synthetic_qa_generator",
+        monkeypatch,
+        argv=["--pdf_name", "unused.pdf", "--start_page", "1", "--end_page", "1"],
+    )
+    monkeypatch.setattr(
+        script, "validate_pdf_path", lambda pdf_name: large_pdf
+    )  # bypass the fixed input folder
+
+    def run():
+        pages = script.extract_text("unused.pdf", 1, NUM_PAGES)
+        qa_pairs = script.generate_qa_pairs(pages)
+        script.compile_dataset(qa_pairs, output_dir)
+
+    benchmark(run)
+    # The fake backend answers every page with the same pairs, deduplicated to one set
+    assert sum(1 for _ in iter_dataset_records(output_dir)) == 3
+    assert fake_chat_backend.calls > 0
+
+
+def test_summarize_documents_batch(benchmark, tmp_path, fake_chat_backend):
+    """Benchmark batch summarization of many small and large documents in one pool"""
+    map_reduce = pytest.importorskip("genaipy.pipelines.map_reduce")
+    pdf_paths = [
+        write_synthetic_pdf(str(tmp_path / f"doc_{idx}.pdf"), num_pages=num_pages)
+        for idx, num_pages in enumerate([2, 3, 40, 5, 60, 1, 8, 20])
+    ]
+    output_dir = str(tmp_path / "summaries")
+
+    summaries = benchmark(
+        map_reduce.summarize_documents, pdf_paths, output_dir=output_dir
+    )
+    assert set(summaries) == set(pdf_paths)
+    assert len(list((tmp_path / "summaries").iterdir())) == len(pdf_paths)
+    assert fake_chat_backend.calls > 0
@@ -0,0 +1,81 @@
+"""Benchmarks for the data conversion and file operation utilities."""
+
+import json
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pd = pytest.importorskip("pandas")
+
+from genaipy.utilities import (  # pylint: disable=wrong-import-position
+    DatasetBuilder,
+    convert_df_to_messages,
+    convert_json_to_df,
+    write_data_to_jsonl,
+)
+
+NUM_RECORDS = 20_000
+SYS_MESSAGE = "You are a legal expert in AI law."
+
+
+@pytest.fixture(scope="module")
+def qa_df():
+    """DataFrame with a large number of question-answer pairs."""
+    return pd.DataFrame(
+        {
+            "question": [
+                f"What does article {idx} regulate?" for idx in range(NUM_RECORDS)
+            ],
+            "answer": [
+                f"Article {idx} regulates the obligations of providers." * 4
+                for idx in range(NUM_RECORDS)
+            ],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def messages(qa_df):
+    """Fine-tuning messages converted from the question-answer pairs."""
+    return convert_df_to_messages(qa_df, SYS_MESSAGE, "question", "answer")
+
+
+def test_convert_json_to_df(benchmark):
+    """Benchmark parsing of a Chat API JSON response into a DataFrame"""
+    json_str = json.dumps(
+        {str(idx): {"question": "Q?", "answer": "A."} for idx in range(NUM_RECORDS)}
+    )
+    df = benchmark(convert_json_to_df, json_str)
+    assert len(df) == NUM_RECORDS
+
+
+def test_convert_df_to_messages(benchmark, qa_df):
+    """Benchmark conversion of a large DataFrame to fine-tuning messages"""
+    output = benchmark(convert_df_to_messages, qa_df, SYS_MESSAGE, "question", "answer")
+    assert len(output) == NUM_RECORDS
+
+
+def test_write_data_to_jsonl(benchmark, tmp_path, messages):
+    """Benchmark writing a large list of messages to a JSON Lines file"""
+    file_path = str(tmp_path / "dataset.jsonl")
+    benchmark(write_data_to_jsonl, messages, file_path)
+    with open(file_path, encoding="utf-8") as file:
+        assert sum(1 for _ in file) == NUM_RECORDS
+
+
+def test_dataset_builder(benchmark, tmp_path, messages):
+    """Benchmark streaming a large list of messages into sharded dataset files"""
+    output_dirs = iter(tmp_path / f"dataset_{idx}" for idx in range(10_000))
+
+    def build():
+        with DatasetBuilder(
+            str(next(output_dirs)), max_shard_bytes=2**20, encoding_name=None
+        ) as builder:
+            for message in messages:
+                builder.add(message)
+        return builder.close()
+
+    manifest = benchmark(build)
+    assert sum(split["num_records"] for split in manifest["splits"].values()) == (
+        NUM_RECORDS
+    )
+    assert len(manifest["shards"]) > 2
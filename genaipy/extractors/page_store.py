@@ -0,0 +1,99 @@
+"""Module for storing extracted page texts on disk behind a dictionary interface."""
+
+import os
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Union
+
+
+class PageStore(Mapping):
+    """
+    Read-only mapping of extracted pages that keeps page texts in a temporary file.
+
+    The store behaves like the dictionary returned by `extract_pages_text`: keys are
+    sequential numbers starting from 1 and values are dictionaries containing the
+    'page_number' and 'content'. Page texts are only loaded from disk when accessed.
+    The temporary file is deleted by `close`, on exiting a `with` block, or when the
+    store is garbage collected.
+
+    Args:
+        directory (str, optional): Folder for the temporary file. Defaults to the
+            system temporary folder.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        handle, self.path = tempfile.mkstemp(
+            prefix="genaipy_pages_", suffix=".sqlite", dir=directory
+        )
+        os.close(handle)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE pages (key INTEGER PRIMARY KEY, page_number INTEGER, content TEXT)"
+        )
+        self._length = 0
+
+    def add(self, key: int, page_number: int, content: str) -> None:
+        """Writes the text of a page to the store."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO pages VALUES (?, ?, ?)", (key, page_number, content)
+            )
+            self._length += 1
+
+    def commit(self) -> None:
+        """Flushes pending writes to disk."""
+        with self._lock:
+            self._conn.commit()
+
+    def __getitem__(self, key: int) -> Dict[str, Union[int, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT page_number, content FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return {"page_number": row[0], "content": row[1]}
+
+    def __iter__(self) -> Iterator[int]:
+        with self._lock:
+            keys = [
+                row[0]
+                for row in self._conn.execute("SELECT key FROM pages ORDER BY key")
+            ]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        """Closes the store and deletes its temporary file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def __enter__(self) -> "PageStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
@@ -1,13 +1,142 @@
 """Module for extracting content from PDF files."""
 
+import importlib
 import logging
-from typing import Dict, Optional, Union
-import PyPDF2
+import mmap
+import os
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
+from genaipy.extractors.page_store import PageStore
+from genaipy.utilities.tracing import traced
 
+# Engines in order of preference for automatic selection, fastest first
+ENGINE_MODULES = {
+    "pypdfium2": ("pypdfium2",),
+    "pymupdf": ("pymupdf", "fitz"),
+    "pypdf2": ("PyPDF2",),
+}
+
+
+def _import_engine(engine: str):
+    """Imports the module backing an engine, returns None if it is not installed."""
+    for module_name in ENGINE_MODULES[engine]:
+        try:
+            return importlib.import_module(module_name)
+        except ImportError:
+            continue
+    return None
+
+
+def available_engines() -> List[str]:
+    """
+    Lists the installed PDF extraction engines.
+
+    Returns:
+        List[str]: Names of the installed engines in order of preference.
+    """
+    return [engine for engine in ENGINE_MODULES if _import_engine(engine) is not None]
+
+
+def _resolve_page_range(
+    start_page: Optional[int], end_page: Optional[int], num_pages: int
+) -> range:
+    """Clamps the requested page range to the pages of the document."""
+    if start_page is None or start_page < 1:
+        start_page = 1
+    if end_page is None or end_page > num_pages:
+        end_page = num_pages
+    return range(start_page, end_page + 1)
+
+
+def _iter_pages_pypdf2(
+    module, pdf_path: str, start_page, end_page, low_memory: bool
+) -> Iterator[Tuple[int, Optional[str]]]:
+    """Yields page numbers and texts extracted with PyPDF2."""
+    with open(pdf_path, "rb") as file:
+        # An empty file cannot be memory mapped, PyPDF2 rejects it from the file
+        low_memory = low_memory and os.fstat(file.fileno()).st_size > 0
+        stream = (
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if low_memory else file
+        )
+        try:
+            reader = module.PdfFileReader(stream)
+            for page_num in _resolve_page_range(start_page, end_page, reader.numPages):
+                try:
+                    yield page_num, reader.getPage(page_num - 1).extractText()
+                except Exception as e:
+                    logging.warning(
+                        "Error extracting text from page %d: %s", page_num, e
+                    )
+                    yield page_num, None
+                finally:
+                    if low_memory:
+                        # Drop cached content streams, fonts and resources of the page
+                        reader.resolved_objects.clear()
+        finally:
+            if low_memory:
+                reader = None
+                stream.close()
+
+
+def _iter_pages_pypdfium2(
+    module, pdf_path: str, start_page, end_page, low_memory: bool
+) -> Iterator[Tuple[int, Optional[str]]]:
+    """Yields page numbers and texts extracted with pypdfium2."""
+    # pdfium reads pages from the file on demand, low_memory needs no extra steps
+    del low_memory
+    document = module.PdfDocument(pdf_path)
+    try:
+        for page_num in _resolve_page_range(start_page, end_page, len(document)):
+            try:
+                page = document[page_num - 1]
+                text_page = page.get_textpage()
+                # pdfium separates lines with "\r\n", the other engines with "\n"
+                content = text_page.get_text_range().replace("\r\n", "\n")
+                text_page.close()
+                page.close()
+                yield page_num, content
+            except Exception as e:
+                logging.warning("Error extracting text from page %d: %s", page_num, e)
+                yield page_num, None
+    finally:
+        document.close()
+
+
+def _iter_pages_pymupdf(
+    module, pdf_path: str, start_page, end_page, low_memory: bool
+) -> Iterator[Tuple[int, Optional[str]]]:
+    """Yields page numbers and texts extracted with PyMuPDF."""
+    # MuPDF reads pages from the file on demand, low_memory needs no extra steps
+    del low_memory
+    document = module.open(pdf_path)
+    try:
+        for page_num in _resolve_page_range(start_page, end_page, document.page_count):
+            try:
+                yield page_num, document.load_page(page_num - 1).get_text()
+            except Exception as e:
+                logging.warning("Error extracting text from page %d: %s", page_num, e)
+                yield page_num, None
+    finally:
+        document.close()
+
+
+_ENGINE_READERS = {
+    "pypdfium2": _iter_pages_pypdfium2,
+    "pymupdf": _iter_pages_pymupdf,
+    "pypdf2": _iter_pages_pypdf2,
+}
+
+
+@traced("extract_pages_text")
 def extract_pages_text(
-    pdf_path: str, start_page: Optional[int] = None, end_page: Optional[int] = None
-) -> Dict[int, Dict[str, Union[int, str]]]:
+    pdf_path: str,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    low_memory: bool = False,
+    spill_to_disk: bool = False,
+    spill_dir: Optional[str] = None,
+    engine: str = "auto",
+) -> Mapping[int, Dict[str, Union[int, str]]]:
     """
     Extracts text from specified page range for given PDF file.
 
@@ -17,46 +146,79 @@ def extract_pages_text(
             If not specified, defaults to the first page.
         end_page (int, optional): The ending page number.
             If not specified, defaults to the last page.
+        low_memory (bool, optional): Reads the file through a read-only memory map and
+            releases parsed PDF objects after each page, trading some speed for a
+            smaller memory footprint. Only affects the "pypdf2" engine, pypdfium2 and
+            PyMuPDF already load pages on demand. Defaults to False.
+        spill_to_disk (bool, optional): Writes page texts to a temporary on-disk
+            `PageStore` instead of holding them in memory. Defaults to False.
+        spill_dir (str, optional): Folder for the temporary file of the `PageStore`.
+            Defaults to the system temporary folder.
+        engine (str, optional): The extraction engine, one of "pypdfium2", "pymupdf",
+            "pypdf2", or "auto" for the fastest installed engine. Defaults to "auto".
 
     Returns:
-        Dict[int, Dict[str, Union[int, str]]]: A dictionary where each key is a sequential number
-        starting from 1, and the values are dictionaries containing the 'page number' and 'content'.
+        Mapping[int, Dict[str, Union[int, str]]]: A dictionary where each key is a sequential
+        number starting from 1, and the values are dictionaries containing the 'page number'
+        and 'content'. A `PageStore` with the same interface if `spill_to_disk` is set.
 
     Raises:
-        ValueError: If `start_page` is greater than `end_page`.
+        ValueError: If `start_page` is greater than `end_page` or the engine is unknown
+            or not installed.
         IOError: If there is an error opening or accessing the PDF file.
+        Exception: Engine specific errors if the file is corrupt or not a PDF, e.g.
+            `PdfReadError` of PyPDF2 or `PdfiumError` of pypdfium2.
     """
-    pdf_pages = {}
-    key_counter = 1
-
     if start_page is not None and end_page is not None and start_page > end_page:
         raise ValueError("start_page must not be greater than end_page.")
 
-    try:
-        with open(pdf_path, "rb") as file:
-            reader = PyPDF2.PdfFileReader(file)
+    if engine != "auto" and engine not in ENGINE_MODULES:
+        raise ValueError(
+            f"Invalid engine '{engine}', must be one of {list(ENGINE_MODULES)} or 'auto'."
+        )
+    # Deferred so importing the extractors does not load any PDF library
+    candidates = list(ENGINE_MODULES) if engine == "auto" else [engine]
+    module = None
+    for engine in candidates:
+        module = _import_engine(engine)
+        if module is not None:
+            break
+    if module is None:
+        raise ValueError(f"No PDF extraction engine installed among {candidates}.")
 
-            if start_page is None or start_page < 1:
-                start_page = 1
-            if end_page is None or end_page > reader.numPages:
-                end_page = reader.numPages
+    pdf_pages = PageStore(spill_dir) if spill_to_disk else {}
+    key_counter = 1
 
-            for page_num in range(start_page, end_page + 1):
-                try:
-                    page = reader.getPage(page_num - 1)
-                    content = page.extractText()
-                    pdf_pages[key_counter] = {
-                        "page_number": page_num,
-                        "content": content,
-                    }
-                    key_counter += 1
-                except Exception as e:
-                    logging.warning(
-                        "Error extracting text from page %d: %s", page_num, e
-                    )
+    try:
+        if not os.path.isfile(pdf_path):
+            raise FileNotFoundError(f"PDF file not found at path: {pdf_path}")
+        pages = _ENGINE_READERS[engine](
+            module, pdf_path, start_page, end_page, low_memory
+        )
+        for page_num, content in pages:
+            if content is None:
+                continue
+            if spill_to_disk:
+                pdf_pages.add(key_counter, page_num, content)
+            else:
+                pdf_pages[key_counter] = {
+                    "page_number": page_num,
+                    "content": content,
+                }
+            key_counter += 1
 
     except IOError as e:
         logging.error("Error opening or accessing the file: %s", e)
+        if spill_to_disk:
+            pdf_pages.close()
+        raise
+    except Exception as e:
+        # Engine specific errors, e.g. for corrupt or non-PDF files
+        logging.error("Error reading the PDF file with %s: %s", engine, e)
+        if spill_to_disk:
+            pdf_pages.close()
         raise
 
+    if spill_to_disk:
+        pdf_pages.commit()
     return pdf_pages
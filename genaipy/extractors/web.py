@@ -2,30 +2,55 @@
 
 import logging
 import re
-import requests
-from bs4 import BeautifulSoup
 
 
-def extract_tags_contents(url: str, tags: list) -> str:
+def fetch_html(url: str, timeout: float = 5) -> bytes:
     """
-    Extracts and processes content from a webpage for given HTML tags.
+    Fetches the raw HTML content of a webpage.
 
     Args:
-        url (str): The URL of the webpage to extract content from.
-        tags (list): A list of HTML tags as strings to extract content from.
+        url (str): The URL of the webpage.
+        timeout (float, optional): Request timeout in seconds. Defaults to 5.
 
     Returns:
-        str: A string containing the processed content extracted from the specified tags.
+        bytes: The HTML content of the webpage.
 
     Raises:
         requests.exceptions.RequestException: If there is an issue with the web request.
-        Exception: If there is an error in parsing the webpage.
     """
+    # Deferred so importing the extractors does not load requests
+    import requests  # pylint: disable=import-outside-toplevel
+
     try:
-        response = requests.get(url, timeout=5)
+        response = requests.get(url, timeout=timeout)
         response.raise_for_status()
+        return response.content
+
+    except requests.exceptions.RequestException as e:
+        logging.error("Error fetching the webpage: %s", e)
+        raise
+
 
-        soup = BeautifulSoup(response.content, "html.parser")
+def extract_tags_from_html(html: bytes, tags: list) -> str:
+    """
+    Extracts and processes content for given HTML tags from HTML content.
+
+    Args:
+        html (bytes): The HTML content to parse.
+        tags (list): A list of HTML tags as strings to extract content from.
+
+    Returns:
+        str: A string containing the processed content extracted from the specified tags.
+
+    Raises:
+        Exception: If there is an error in parsing the HTML content.
+    """
+    # Deferred so importing the extractors does not load bs4
+    from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
+
+    # TODO: Consider implementing custom exception
+    try:
+        soup = BeautifulSoup(html, "html.parser")
         extracted_texts = []
         for element in soup.find_all(tags):
             text = " ".join(element.stripped_strings)
@@ -34,11 +59,24 @@ def extract_tags_contents(url: str, tags: list) -> str:
 
         return "\n\n".join(extracted_texts)
 
-    except requests.exceptions.RequestException as e:
-        logging.error("Error fetching the webpage: %s", e)
-        raise
-
-    # TODO: Consider implementing custom exception
     except Exception as e:  # Catch exceptions related to parsing
         logging.error("Error parsing the webpage: %s", e)
         raise
+
+
+def extract_tags_contents(url: str, tags: list) -> str:
+    """
+    Extracts and processes content from a webpage for given HTML tags.
+
+    Args:
+        url (str): The URL of the webpage to extract content from.
+        tags (list): A list of HTML tags as strings to extract content from.
+
+    Returns:
+        str: A string containing the processed content extracted from the specified tags.
+
+    Raises:
+        requests.exceptions.RequestException: If there is an issue with the web request.
+        Exception: If there is an error in parsing the webpage.
+    """
+    return extract_tags_from_html(fetch_html(url, timeout=5), tags)
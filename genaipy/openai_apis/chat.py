@@ -1,10 +1,19 @@
 """Module for interfacing with the OpenAI Chat API"""
 
+import importlib.util
 import logging
+import math
+import threading
 import time
-from typing import Any
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+import httpx
 import openai
 
+from genaipy.utilities.token_counting import count_message_tokens
+from genaipy.utilities.tracing import traced
+
 
 # Custom Exceptions for Chat API
 class ChatAPIRequestException(Exception):
@@ -15,6 +24,428 @@ class ChatAPIResponseException(Exception):
     """Exception raised for errors in processing the OpenAI Chat API response."""
 
 
+# Shared client
+_client = None
+_client_lock = threading.Lock()
+_MODULE_SETTINGS = ("api_key", "organization", "base_url", "default_headers")
+
+
+def _build_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    timeout: float = 60.0,
+    connect_timeout: float = 5.0,
+    http2: Optional[bool] = None,
+    **kwargs: Any,
+) -> openai.OpenAI:
+    """Creates an OpenAI client on top of a pooled HTTP client."""
+    # Honour settings made on the module, e.g. `openai.api_key = ...`
+    for name in _MODULE_SETTINGS:
+        value = getattr(openai, name, None)
+        if value is not None:
+            kwargs.setdefault(name, value)
+    if http2 is None:
+        http2 = importlib.util.find_spec("h2") is not None
+    # openai sends its own timeout with every request, so it needs the connect timeout too
+    timeouts = httpx.Timeout(timeout, connect=connect_timeout)
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=timeouts,
+        http2=http2,
+    )
+    return openai.OpenAI(http_client=http_client, timeout=timeouts, **kwargs)
+
+
+def _replace_client(client: Optional[openai.OpenAI]) -> None:
+    """Swaps the shared client and closes the connection pool of the previous one."""
+    global _client  # pylint: disable=global-statement
+    with _client_lock:
+        previous, _client = _client, client
+    close = getattr(previous, "close", None)
+    if previous is not client and close is not None:
+        close()
+
+
+def configure_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    timeout: float = 60.0,
+    connect_timeout: float = 5.0,
+    http2: Optional[bool] = None,
+    **kwargs: Any,
+) -> openai.OpenAI:
+    """
+    Creates the OpenAI client shared by all Chat and Embeddings API helpers.
+
+    The client keeps a pool of HTTP connections alive, so concurrent requests from
+    many threads reuse TCP and TLS connections instead of opening one per request.
+    A previously configured client is closed, so configure the client before
+    starting concurrent requests.
+
+    Parameters:
+    - max_connections (int, optional): Maximum number of open connections. Defaults to 100.
+    - max_keepalive_connections (int, optional): Maximum number of idle connections kept
+      alive. Defaults to 20.
+    - keepalive_expiry (float, optional): Seconds an idle connection is kept alive.
+      Defaults to 30.
+    - timeout (float, optional): Default timeout of a request in seconds. Defaults to 60.
+      Override per request by passing `timeout` to the request helpers.
+    - connect_timeout (float, optional): Timeout for opening a connection in seconds.
+      Defaults to 5.
+    - http2 (bool, optional): Whether to use HTTP/2. Defaults to using it if the `h2`
+      package is installed.
+    - **kwargs: Additional keyword arguments passed to `openai.OpenAI`, e.g. `api_key`.
+      Module-level settings such as `openai.api_key`, `openai.organization` and
+      `openai.base_url` are used unless overridden here.
+
+    Returns:
+    - openai.OpenAI: The shared client.
+    """
+    client = _build_client(
+        max_connections,
+        max_keepalive_connections,
+        keepalive_expiry,
+        timeout,
+        connect_timeout,
+        http2,
+        **kwargs,
+    )
+    _replace_client(client)
+    return client
+
+
+def set_client(client: Optional[openai.OpenAI]) -> None:
+    """
+    Sets the shared client, e.g. an `openai.AzureOpenAI` client or a test double.
+
+    The previously shared client is closed.
+
+    Parameters:
+    - client (openai.OpenAI, optional): The client to share. None resets to a default
+      client created by `configure_client` on next use.
+    """
+    _replace_client(client)
+
+
+def get_client() -> openai.OpenAI:
+    """
+    Returns the shared client, creating it with default settings on first use.
+
+    Returns:
+    - openai.OpenAI: The shared client.
+    """
+    global _client  # pylint: disable=global-statement
+    client = _client
+    if client is not None:
+        return client
+    with _client_lock:
+        if _client is None:
+            _client = _build_client()
+        return _client
+
+
+# Model routing
+class ModelRoute(NamedTuple):
+    """
+    Routing rule describing when a model may serve a request.
+
+    Attributes:
+    - model (str): The name of the OpenAI model.
+    - max_input_tokens (int): Largest prompt size in tokens the model should receive.
+    - tasks (FrozenSet[str], optional): Task tags the model serves. None serves all tasks.
+    - cost_per_1k_tokens (float, optional): Input cost per 1,000 tokens. Defaults to 0.
+    - expected_latency (float, optional): Expected latency in seconds. Defaults to 0.
+    """
+
+    model: str
+    max_input_tokens: int
+    tasks: Optional[FrozenSet[str]] = None
+    cost_per_1k_tokens: float = 0.0
+    expected_latency: float = 0.0
+
+
+class ModelRouter:
+    """
+    Selects a model per request by input token count, task tag and budgets.
+
+    Routes are ranked by cost and then latency, so cheap fast models take every
+    request they are eligible for. A model that fails `failure_threshold` times in
+    a row is skipped for `cooldown` seconds and requests go to its fallback model.
+    The router is thread-safe.
+
+    Parameters:
+    - routes (List[ModelRoute]): The routing rules.
+    - fallbacks (Dict[str, str], optional): Alternate model to use per model on failures.
+      A fallback is only used if it has a route eligible for the request.
+    - max_cost_per_request (float, optional): Input cost budget per request.
+    - max_latency (float, optional): Expected latency budget per request in seconds.
+    - failure_threshold (int, optional): Consecutive failures before a model is
+      skipped. Defaults to 2.
+    - cooldown (float, optional): Seconds a failing model is skipped. Defaults to 60.
+    """
+
+    def __init__(
+        self,
+        routes: List[ModelRoute],
+        fallbacks: Optional[Dict[str, str]] = None,
+        max_cost_per_request: Optional[float] = None,
+        max_latency: Optional[float] = None,
+        failure_threshold: int = 2,
+        cooldown: float = 60.0,
+    ):
+        if not routes:
+            raise ValueError("ModelRouter requires at least one route.")
+        self.routes = sorted(
+            routes, key=lambda route: (route.cost_per_1k_tokens, route.expected_latency)
+        )
+        self.fallbacks = dict(fallbacks or {})
+        self.max_cost_per_request = max_cost_per_request
+        self.max_latency = max_latency
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = {}
+        self._disabled_until = {}
+        self._lock = threading.Lock()
+
+    def _is_available(self, model: str) -> bool:
+        with self._lock:
+            return self._disabled_until.get(model, 0.0) <= time.monotonic()
+
+    def _within_budget(self, route: ModelRoute, num_tokens: int) -> bool:
+        cost = num_tokens / 1000 * route.cost_per_1k_tokens
+        if self.max_cost_per_request is not None and cost > self.max_cost_per_request:
+            return False
+        if self.max_latency is not None and route.expected_latency > self.max_latency:
+            return False
+        return True
+
+    def _eligible_routes(
+        self, num_tokens: int, task: Optional[str]
+    ) -> List[ModelRoute]:
+        return [
+            route
+            for route in self.routes
+            if (route.tasks is None or task in route.tasks)
+            and num_tokens <= route.max_input_tokens
+        ]
+
+    def select_model(self, messages: List[dict], task: Optional[str] = None) -> str:
+        """
+        Selects the model for a request.
+
+        Parameters:
+        - messages (List[dict]): The messages to send to the API.
+        - task (str, optional): The task tag of the request, e.g. "map" or "reduce".
+
+        Returns:
+        - str: The name of the selected model.
+
+        Raises:
+        - ValueError: If no route serves the task with the given input size.
+        """
+        num_tokens = count_message_tokens(messages)
+        eligible = self._eligible_routes(num_tokens, task)
+        if not eligible:
+            raise ValueError(
+                f"No model route for task '{task}' with {num_tokens} input tokens."
+            )
+
+        available = [route for route in eligible if self._is_available(route.model)]
+        for route in available:
+            if self._within_budget(route, num_tokens):
+                return route.model
+
+        # Budgets cannot be met, overshoot them as little as possible with the
+        # cheapest healthy route
+        candidates = available or eligible
+        model = min(
+            candidates,
+            key=lambda route: (route.cost_per_1k_tokens, route.expected_latency),
+        ).model
+        logging.warning(
+            "No model within budget for task '%s' (%d tokens), using %s.",
+            task,
+            num_tokens,
+            model,
+        )
+        return model
+
+    def get_fallback(
+        self, model: str, messages: List[dict], task: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Returns the fallback model for a failed request.
+
+        Parameters:
+        - model (str): The model that failed.
+        - messages (List[dict]): The messages of the request.
+        - task (str, optional): The task tag of the request.
+
+        Returns:
+        - str: The fallback model, or None if none is configured, it has no route
+          eligible for the task and input size, or it is currently skipped.
+        """
+        fallback = self.fallbacks.get(model)
+        if fallback is None:
+            return None
+        num_tokens = count_message_tokens(messages)
+        eligible = self._eligible_routes(num_tokens, task)
+        if not any(route.model == fallback for route in eligible):
+            logging.warning(
+                "Fallback %s has no route for task '%s' (%d tokens).",
+                fallback,
+                task,
+                num_tokens,
+            )
+            return None
+        if not self._is_available(fallback):
+            logging.warning("Fallback %s is skipped after repeated failures.", fallback)
+            return None
+        return fallback
+
+    def record_success(self, model: str) -> None:
+        """Resets the failure count of a model."""
+        with self._lock:
+            self._failures[model] = 0
+
+    def record_failure(self, model: str) -> None:
+        """Counts a failed request and skips the model for a while if it keeps failing."""
+        with self._lock:
+            self._failures[model] = self._failures.get(model, 0) + 1
+            if self._failures[model] >= self.failure_threshold:
+                self._disabled_until[model] = time.monotonic() + self.cooldown
+                self._failures[model] = 0
+                logging.warning(
+                    "Model %s failed repeatedly, skipping it for %.0f seconds.",
+                    model,
+                    self.cooldown,
+                )
+
+
+# Request hedging
+class HedgingPolicy:
+    """
+    Decides when to send a duplicate request for a slow Chat API call.
+
+    The policy keeps a sliding window of recent request latencies. Once a request
+    runs longer than the configured percentile of that window, a duplicate request
+    is sent (optionally to a fallback model) and the first successful response wins.
+    The share of hedged requests is capped to bound the extra spend. The policy is
+    thread-safe and can be shared by concurrent callers.
+
+    Parameters:
+    - percentile (float, optional): Latency percentile after which to hedge. Defaults to 95.
+    - window (int, optional): Number of recent latencies to keep. Defaults to 100.
+    - min_samples (int, optional): Latencies required before hedging starts. Defaults to 20.
+    - max_hedge_ratio (float, optional): Maximum share of requests that may be hedged.
+      Defaults to 0.1.
+    - fallback_model (str, optional): Model for the duplicate request. Defaults to the
+      model of the original request.
+    - max_workers (int, optional): Threads running original and hedged requests.
+      Defaults to twice the number of concurrent requests, grown as needed so
+      requests do not wait for a free thread.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        window: int = 100,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.1,
+        fallback_model: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100.")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.fallback_model = fallback_model
+        self.max_workers = max_workers
+        self.num_requests = 0
+        self.num_hedges = 0
+        self._latencies = deque(maxlen=window)
+        self._active = 0  # requests currently in progress
+        self._executor = None
+        self._pool_size = 0
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Runs a request on the thread pool, growing the pool with the concurrency."""
+        with self._lock:
+            needed = self.max_workers or max(4, 2 * self._active)
+            if self._executor is None or self._pool_size < needed:
+                previous = self._executor
+                self._pool_size = self.max_workers or max(needed, 2 * self._pool_size)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size, thread_name_prefix="hedge"
+                )
+                if previous is not None:
+                    previous.shutdown(wait=False)  # lets its running requests finish
+            return self._executor.submit(func, *args, **kwargs)
+
+    def record_latency(self, seconds: float) -> None:
+        """Adds the latency of a completed request to the window."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Returns the seconds after which to hedge, or None if there are too few samples."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        idx = min(
+            len(latencies) - 1, math.ceil(self.percentile / 100 * len(latencies)) - 1
+        )
+        return latencies[idx]
+
+    def start_request(self) -> None:
+        """Counts a request towards the hedge budget and the pool size."""
+        with self._lock:
+            self.num_requests += 1
+            self._active += 1
+
+    def finish_request(self) -> None:
+        """Marks a request counted by `start_request` as completed."""
+        with self._lock:
+            self._active -= 1
+
+    def acquire_hedge(self) -> bool:
+        """Reserves a hedge if the share of hedged requests stays within budget."""
+        with self._lock:
+            if self.num_hedges + 1 > self.max_hedge_ratio * self.num_requests:
+                return False
+            self.num_hedges += 1
+            return True
+
+    def shutdown(self) -> None:
+        """Shuts down the thread pool without waiting for discarded requests."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                self._pool_size = 0
+
+
+def _timed_chat_completion(
+    started: threading.Event, messages: dict, model: str, **kwargs: Any
+) -> Tuple[dict, Optional[float]]:
+    """Runs `request_chat_completion` and returns the latency of its successful attempt."""
+    started.set()
+    latencies = []
+    completion = request_chat_completion(
+        messages, model=model, latency_callback=latencies.append, **kwargs
+    )
+    return completion, (latencies[-1] if latencies else None)
+
+
 # Functions for interfacing with Chat API
 def construct_chat_message(role: str, content: str) -> dict:
     """
@@ -38,7 +469,11 @@ def construct_chat_message(role: str, content: str) -> dict:
 
 
 def request_chat_completion(
-    messages: dict, model: str = "gpt-3.5-turbo", max_retries: int = 3, **kwargs: Any
+    messages: dict,
+    model: str = "gpt-3.5-turbo",
+    max_retries: int = 3,
+    latency_callback: Optional[Callable[[float], None]] = None,
+    **kwargs: Any,
 ) -> dict:
     """
     Requests a completion from OpenAI's Chat API.
@@ -47,7 +482,10 @@ def request_chat_completion(
     - messages (dict): The messages sent to the API.
     - model (str, optional): The model to be used for the API call. Defaults to "gpt-3.5-turbo".
     - max_retries (int, optional): Maximum number of retries in case of API failures. Defaults to 3.
-    - **kwargs: Additional keyword arguments passed to the openai.ChatCompletion.create method.
+    - latency_callback (Callable[[float], None], optional): Called with the latency in
+      seconds of the successful attempt, excluding failed attempts and retry delays.
+    - **kwargs: Additional keyword arguments passed to the openai.ChatCompletion.create method,
+      e.g. `timeout` to override the timeout of the shared client for this request.
 
     Returns:
     - dict: The API response.
@@ -61,9 +499,12 @@ def request_chat_completion(
 
     for attempt in range(max_retries):
         try:
-            completion = openai.chat.completions.create(
+            start = time.monotonic()
+            completion = get_client().chat.completions.create(
                 model=model, messages=messages, **kwargs
             )
+            if latency_callback is not None:
+                latency_callback(time.monotonic() - start)
             return completion
         except Exception as e:
             last_error_msg = str(e)
@@ -76,8 +517,146 @@ def request_chat_completion(
     )
 
 
+def request_hedged_chat_completion(
+    messages: dict,
+    policy: HedgingPolicy,
+    model: str = "gpt-3.5-turbo",
+    **kwargs: Any,
+) -> dict:
+    """
+    Requests a completion and hedges it with a duplicate request if it is slow.
+
+    The hedge delay is measured from the moment the original request starts running.
+    Only the latency of the winning request's successful attempt is recorded in the
+    policy. The losing request is cancelled if it has not started yet. A request
+    already in flight cannot be interrupted, its response is discarded when it arrives.
+
+    Parameters:
+    - messages (dict): The messages sent to the API.
+    - policy (HedgingPolicy): The policy deciding when to hedge.
+    - model (str, optional): The model to be used for the API call. Defaults to "gpt-3.5-turbo".
+    - **kwargs: Additional keyword arguments passed to `request_chat_completion`.
+
+    Returns:
+    - dict: The API response of the first successful request.
+
+    Raises:
+    - ChatAPIRequestException: If all requests fail.
+    """
+
+    policy.start_request()
+    try:
+        started = threading.Event()
+        pending = {
+            policy.submit(_timed_chat_completion, started, messages, model, **kwargs)
+        }
+
+        delay = policy.hedge_delay()
+        if delay is not None:
+            started.wait()  # time waiting for a thread does not count as latency
+            done, _ = wait(pending, timeout=delay)
+            if not done and policy.acquire_hedge():
+                hedge_model = policy.fallback_model or model
+                logging.info(
+                    "Request exceeded %.2fs, sending hedged request to %s.",
+                    delay,
+                    hedge_model,
+                )
+                pending.add(
+                    policy.submit(
+                        _timed_chat_completion,
+                        threading.Event(),
+                        messages,
+                        hedge_model,
+                        **kwargs,
+                    )
+                )
+
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    completion, latency = future.result()
+                except ChatAPIRequestException as e:
+                    last_error = e
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if latency is not None:
+                    policy.record_latency(latency)
+                return completion
+
+        raise last_error
+    finally:
+        policy.finish_request()
+
+
+def request_routed_chat_completion(
+    messages: dict,
+    router: ModelRouter,
+    task: Optional[str] = None,
+    hedging: Optional[HedgingPolicy] = None,
+    **kwargs: Any,
+) -> dict:
+    """
+    Requests a completion from OpenAI's Chat API with the model chosen by a router.
+
+    If the selected model fails after all retries, the request is repeated once with
+    the router's fallback model for it, provided the fallback is eligible for the
+    request. Failures of either model count towards skipping it.
+
+    Parameters:
+    - messages (dict): The messages sent to the API.
+    - router (ModelRouter): The router selecting the model.
+    - task (str, optional): The task tag of the request. Defaults to None.
+    - hedging (HedgingPolicy, optional): Policy for hedging slow requests. Defaults to None.
+    - **kwargs: Additional keyword arguments passed to `request_chat_completion`.
+
+    Returns:
+    - dict: The API response.
+
+    Raises:
+    - ChatAPIRequestException: If the selected and the fallback model both fail.
+    """
+
+    def request(model):
+        if hedging is not None:
+            return request_hedged_chat_completion(
+                messages, policy=hedging, model=model, **kwargs
+            )
+        return request_chat_completion(messages, model=model, **kwargs)
+
+    model = router.select_model(messages, task=task)
+    try:
+        completion = request(model)
+        router.record_success(model)
+        return completion
+    except ChatAPIRequestException:
+        router.record_failure(model)
+        fallback = router.get_fallback(model, messages, task=task)
+        if fallback is None:
+            raise
+        logging.warning("Model %s failed, falling back to %s.", model, fallback)
+
+    try:
+        completion = request(fallback)
+    except ChatAPIRequestException:
+        router.record_failure(fallback)
+        raise
+    router.record_success(fallback)
+    return completion
+
+
+@traced("get_chat_response")
 def get_chat_response(
-    prompt: str, sys_message: str = "", model: str = "gpt-3.5-turbo", **kwargs: Any
+    prompt: str,
+    sys_message: str = "",
+    model: str = "gpt-3.5-turbo",
+    router: Optional[ModelRouter] = None,
+    task: Optional[str] = None,
+    hedging: Optional[HedgingPolicy] = None,
+    **kwargs: Any,
 ) -> str:
     """
     Generates a chat response using OpenAI's Chat API.
@@ -86,6 +665,11 @@ def get_chat_response(
         prompt (str): The message from the user.
         sys_message (str, optional): A system message for the LLM. Defaults to an empty string.
         model (str, optional): The name of the OpenAI model to use. Defaults to "gpt-3.5-turbo".
+        router (ModelRouter, optional): Router selecting the model per request. If given,
+            `model` is ignored. Defaults to None.
+        task (str, optional): Task tag passed to the router. Defaults to None.
+        hedging (HedgingPolicy, optional): Policy for hedging slow requests with a
+            duplicate request. Defaults to None.
         **kwargs: Additional keyword arguments to pass to the `request_chat_completion` function.
 
     Returns:
@@ -102,7 +686,16 @@ def get_chat_response(
     messages.append(construct_chat_message("user", prompt))
 
     try:
-        completion = request_chat_completion(messages, model=model, **kwargs)
+        if router is not None:
+            completion = request_routed_chat_completion(
+                messages, router=router, task=task, hedging=hedging, **kwargs
+            )
+        elif hedging is not None:
+            completion = request_hedged_chat_completion(
+                messages, policy=hedging, model=model, **kwargs
+            )
+        else:
+            completion = request_chat_completion(messages, model=model, **kwargs)
 
         logging.info(
             "Successfully completed Chat API request. Total token usage: %d",
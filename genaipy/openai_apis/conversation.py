@@ -0,0 +1,206 @@
+"""Module for multi-turn conversations with the OpenAI Chat API."""
+
+import logging
+from collections import deque
+from typing import Any, List, Optional
+
+from genaipy.openai_apis.chat import (
+    ChatAPIResponseException,
+    construct_chat_message,
+    get_chat_response,
+    request_chat_completion,
+)
+from genaipy.prompts.build_prompt import build_prompt
+from genaipy.prompts.generate_summaries import CONVERSATION_SUMMARY_PROMPT_TPL
+from genaipy.utilities.token_counting import TOKENS_PER_MESSAGE, count_tokens
+
+TRUNCATE = "truncate"
+SUMMARIZE = "summarize"
+
+
+class Conversation:
+    """
+    Multi-turn conversation that keeps its prompt within a token budget.
+
+    The history is stored as compact (role, content, tokens) tuples and the token
+    total is updated incrementally on every change. Before each request, the oldest
+    turns are dropped ("truncate") or condensed into a running summary ("summarize")
+    until the prompt fits `max_prompt_tokens`.
+
+    Args:
+        sys_message (str, optional): A system message for the LLM. Defaults to an empty string.
+        model (str, optional): The name of the OpenAI model to use. Defaults to "gpt-3.5-turbo".
+        max_prompt_tokens (int, optional): Token budget of the messages sent per request.
+            Defaults to 3000.
+        strategy (str, optional): Either "truncate" or "summarize". Defaults to "truncate".
+        keep_last_messages (int, optional): Number of most recent messages that are never
+            truncated or summarized. Defaults to 2.
+        summary_model (str, optional): Model used to summarize older turns.
+            Defaults to `model`.
+        summary_max_words (int, optional): Maximum words of the running summary.
+            Defaults to 200.
+
+    Raises:
+        ValueError: If `strategy` is not "truncate" or "summarize".
+    """
+
+    def __init__(
+        self,
+        sys_message: str = "",
+        model: str = "gpt-3.5-turbo",
+        max_prompt_tokens: int = 3000,
+        strategy: str = TRUNCATE,
+        keep_last_messages: int = 2,
+        summary_model: Optional[str] = None,
+        summary_max_words: int = 200,
+    ):
+        if strategy not in {TRUNCATE, SUMMARIZE}:
+            raise ValueError(
+                f"Invalid strategy, must be '{TRUNCATE}' or '{SUMMARIZE}'."
+            )
+        self.model = model
+        self.max_prompt_tokens = max_prompt_tokens
+        self.strategy = strategy
+        self.keep_last_messages = keep_last_messages
+        self.summary_model = summary_model or model
+        self.summary_max_words = summary_max_words
+
+        self._sys_message = sys_message
+        self._sys_tokens = self._count(sys_message) if sys_message else 0
+        self._summary = ""
+        self._summary_tokens = 0
+        self._history = deque()
+        self._history_tokens = 0
+
+    @staticmethod
+    def _count(content: str) -> int:
+        return count_tokens(content) + TOKENS_PER_MESSAGE
+
+    @property
+    def num_tokens(self) -> int:
+        """The number of prompt tokens of the current messages."""
+        return self._sys_tokens + self._summary_tokens + self._history_tokens
+
+    @property
+    def summary(self) -> str:
+        """The running summary of condensed turns, empty if nothing was condensed."""
+        return self._summary
+
+    @property
+    def messages(self) -> List[dict]:
+        """The messages sent with the next request."""
+        messages = []
+        if self._sys_message:
+            messages.append(construct_chat_message("system", self._sys_message))
+        if self._summary:
+            messages.append(
+                construct_chat_message(
+                    "system", f"Summary of the earlier conversation:\n{self._summary}"
+                )
+            )
+        messages.extend(
+            construct_chat_message(role, content) for role, content, _ in self._history
+        )
+        return messages
+
+    def add_message(self, role: str, content: str) -> None:
+        """
+        Appends a message to the history.
+
+        Args:
+            role (str): Either "user" or "assistant".
+            content (str): The content of the message.
+
+        Raises:
+            ValueError: If the role is not "user" or "assistant".
+        """
+        if role not in {"user", "assistant"}:
+            raise ValueError("Invalid role, must be one of {'user', 'assistant'}.")
+        tokens = self._count(content)
+        self._history.append((role, content, tokens))
+        self._history_tokens += tokens
+
+    def _pop_oldest(self) -> tuple:
+        message = self._history.popleft()
+        self._history_tokens -= message[2]
+        return message
+
+    def _summarize(self, old_messages: List[tuple]) -> None:
+        """Folds old messages and the previous summary into a new running summary."""
+        lines = [f"Earlier summary: {self._summary}"] if self._summary else []
+        lines.extend(f"{role}: {content}" for role, content, _ in old_messages)
+        prompt = build_prompt(
+            template=CONVERSATION_SUMMARY_PROMPT_TPL,
+            text="\n".join(lines),
+            max_words=self.summary_max_words,
+        )
+        self._summary = get_chat_response(prompt, model=self.summary_model)
+        self._summary_tokens = self._count(self._summary)
+
+    def fit_to_budget(self) -> None:
+        """Drops or summarizes the oldest messages until the prompt fits the budget."""
+        if self.num_tokens <= self.max_prompt_tokens:
+            return
+
+        old_messages = []
+        while (
+            self.num_tokens > self.max_prompt_tokens
+            and len(self._history) > self.keep_last_messages
+        ):
+            old_messages.append(self._pop_oldest())
+
+        if old_messages:
+            logging.info(
+                "Removed %d old messages from conversation (%s).",
+                len(old_messages),
+                self.strategy,
+            )
+            if self.strategy == SUMMARIZE:
+                try:
+                    self._summarize(old_messages)
+                except ChatAPIResponseException as e:
+                    logging.error("Failed to summarize, truncating instead: %s", e)
+
+        if self.num_tokens > self.max_prompt_tokens:
+            logging.warning(
+                "Conversation exceeds token budget: %d > %d tokens.",
+                self.num_tokens,
+                self.max_prompt_tokens,
+            )
+
+    def send(self, prompt: str, **kwargs: Any) -> str:
+        """
+        Sends a user message and records the LLM's response in the history.
+
+        Args:
+            prompt (str): The message from the user.
+            **kwargs: Additional keyword arguments to pass to the `request_chat_completion`
+                function.
+
+        Returns:
+            str: The content of the LLM's response.
+
+        Raises:
+            ChatAPIRequestException: For errors during the API request process.
+        """
+        self.add_message("user", prompt)
+        self.fit_to_budget()
+
+        try:
+            completion = request_chat_completion(
+                self.messages, model=self.model, **kwargs
+            )
+        except Exception:
+            if self._history and self._history[-1][:2] == ("user", prompt):
+                self._history_tokens -= self._history.pop()[2]  # allow a clean retry
+            raise
+        logging.info(
+            "Conversation turn completed. Total token usage: %d",
+            completion.usage.total_tokens,
+        )
+        response = completion.choices[0].message.content
+        self.add_message("assistant", response)
+        return response
+
+    def __len__(self) -> int:
+        return len(self._history)
@@ -0,0 +1,57 @@
+"""Module for interfacing with the OpenAI Embeddings API"""
+
+import logging
+import time
+from typing import Any, List
+
+from genaipy.openai_apis.chat import get_client
+
+
+class EmbeddingAPIRequestException(Exception):
+    """Exception raised for errors in the OpenAI Embeddings API request process."""
+
+
+def get_embeddings(
+    texts: List[str],
+    model: str = "text-embedding-ada-002",
+    max_retries: int = 3,
+    **kwargs: Any,
+) -> List[List[float]]:
+    """
+    Requests embeddings for a list of texts from OpenAI's Embeddings API.
+
+    Args:
+        texts (List[str]): The texts to embed.
+        model (str, optional): The embedding model to use. Defaults to "text-embedding-ada-002".
+        max_retries (int, optional): Maximum number of retries in case of API failures.
+            Defaults to 3.
+        **kwargs: Additional keyword arguments passed to the embeddings.create method
+            of the shared client from `genaipy.openai_apis.chat.get_client`.
+
+    Returns:
+        List[List[float]]: One embedding vector per text, in input order.
+
+    Raises:
+        EmbeddingAPIRequestException: For errors during the API request process.
+    """
+
+    last_error_msg = ""
+    retry_delay = 1  # Initial delay for exponential backoff
+
+    for attempt in range(max_retries):
+        try:
+            response = get_client().embeddings.create(
+                model=model, input=texts, **kwargs
+            )
+            return [
+                item.embedding for item in sorted(response.data, key=lambda d: d.index)
+            ]
+        except Exception as e:
+            last_error_msg = str(e)
+            logging.error("Attempt %d failed: %s", attempt + 1, last_error_msg)
+            time.sleep(retry_delay)
+            retry_delay *= 2  # Exponential backoff
+
+    raise EmbeddingAPIRequestException(
+        f"Failed after {max_retries} retries. Last error message: {last_error_msg}"
+    )
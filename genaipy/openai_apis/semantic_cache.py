@@ -0,0 +1,281 @@
+"""Module for caching chat responses by semantic similarity of prompts."""
+
+import hashlib
+import logging
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from genaipy.openai_apis.chat import get_chat_response
+from genaipy.openai_apis.embeddings import get_embeddings
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_ANN_INITIAL_CAPACITY = 1024
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapses runs of whitespace so trivially different prompts match exactly."""
+    return _WHITESPACE_RE.sub(" ", prompt).strip()
+
+
+class SemanticCache:
+    """
+    Cache answering near-identical prompts from earlier chat responses.
+
+    Prompts are whitespace-normalized and looked up by exact hash first. On a miss,
+    the prompt embedding is compared against cached embeddings of the same namespace
+    (template, model, system message and request options) and the most similar entry
+    above the similarity threshold is returned. Embeddings are kept in one NumPy
+    matrix searched by brute force, or in an optional HNSW index per namespace
+    (requires `hnswlib`). When full, the least recently used entry is evicted.
+
+    Args:
+        embed_fn (Callable, optional): Function mapping a list of texts to a list of
+            embedding vectors. Defaults to `get_embeddings`.
+        threshold (float, optional): Minimum cosine similarity for a cache hit.
+            Defaults to 0.95.
+        thresholds (Dict[str, float], optional): Thresholds per template name that
+            override `threshold`. Defaults to None.
+        max_entries (int, optional): Maximum number of cached responses. Defaults to 10000.
+        use_ann (bool, optional): Search an HNSW index instead of brute force.
+            Defaults to False.
+        ann_candidates (int, optional): Nearest neighbours retrieved per ANN query.
+            Defaults to 10.
+
+    Raises:
+        ImportError: If `use_ann` is True and `hnswlib` is not installed.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
+        threshold: float = 0.95,
+        thresholds: Optional[Dict[str, float]] = None,
+        max_entries: int = 10_000,
+        use_ann: bool = False,
+        ann_candidates: int = 10,
+    ):
+        if use_ann:
+            try:
+                import hnswlib  # pylint: disable=import-outside-toplevel,unused-import
+            except ImportError as e:
+                raise ImportError("use_ann=True requires the 'hnswlib' package.") from e
+
+        self.embed_fn = embed_fn or get_embeddings
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+        self.max_entries = max_entries
+        self.use_ann = use_ann
+        self.ann_candidates = ann_candidates
+        self.hits = 0
+        self.misses = 0
+
+        self._vectors = None  # allocated on first insert once the dimension is known
+        self._namespace_ids = np.full(max_entries, -1, dtype=np.int64)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._responses = [None] * max_entries
+        self._keys = [None] * max_entries
+        self._namespaces = {}  # namespace -> id
+        self._namespace_sizes = {}  # namespace id -> number of entries
+        self._exact = {}  # hash of namespace and normalized prompt -> slot
+        self._size = 0
+        self._clock = 0
+        self._ann_indexes = {}  # namespace id -> HNSW index of its entries
+        self._ann_slots = {}  # HNSW label -> slot
+        self._slot_labels = np.zeros(max_entries, dtype=np.int64)
+        self._next_label = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _exact_key(text: str, namespace: str) -> str:
+        return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(self.embed_fn([text])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _touch(self, slot: int) -> str:
+        self._clock += 1
+        self._last_used[slot] = self._clock
+        return self._responses[slot]
+
+    def _candidate_slots(self, vector: np.ndarray, namespace_id: int) -> np.ndarray:
+        if not self.use_ann:
+            slots = np.arange(self._size)
+            return slots[self._namespace_ids[slots] == namespace_id]
+        # Each namespace has its own index, so entries of other namespaces can never
+        # crowd out the nearest neighbours of this one
+        k = min(self.ann_candidates, self._namespace_sizes.get(namespace_id, 0))
+        if k == 0:
+            return np.empty(0, dtype=np.int64)
+        labels, _ = self._ann_indexes[namespace_id].knn_query(vector, k=k)
+        return np.array([self._ann_slots[label] for label in labels[0]], dtype=np.int64)
+
+    def _search(self, vector: np.ndarray, namespace: str, threshold: float):
+        namespace_id = self._namespaces.get(namespace)
+        if namespace_id is None or self._size == 0:
+            return None
+        slots = self._candidate_slots(vector, namespace_id)
+        if slots.size == 0:
+            return None
+        similarities = self._vectors[slots] @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < threshold:
+            return None
+        return self._touch(int(slots[best]))
+
+    def _ann_add(self, slot: int, vector: np.ndarray, namespace_id: int) -> None:
+        index = self._ann_indexes.get(namespace_id)
+        if index is None:
+            import hnswlib  # pylint: disable=import-outside-toplevel
+
+            index = hnswlib.Index(space="ip", dim=vector.shape[0])
+            index.init_index(
+                max_elements=min(self.max_entries, _ANN_INITIAL_CAPACITY),
+                allow_replace_deleted=True,
+            )
+            self._ann_indexes[namespace_id] = index
+        elif self._namespace_sizes[namespace_id] > index.get_max_elements():
+            # No free or deleted element left to reuse
+            index.resize_index(min(2 * index.get_max_elements(), self.max_entries))
+
+        # Labels are never reused, so a slot moving between namespaces cannot
+        # collide with its deleted element in the index it left
+        label = self._next_label
+        self._next_label += 1
+        index.add_items(vector[np.newaxis], [label], replace_deleted=True)
+        self._ann_slots[label] = slot
+        self._slot_labels[slot] = label
+
+    def _ann_remove(self, slot: int, namespace_id: int) -> None:
+        label = int(self._slot_labels[slot])
+        self._ann_indexes[namespace_id].mark_deleted(label)
+        del self._ann_slots[label]
+
+    def _insert(self, key: str, vector: np.ndarray, response: str, namespace: str):
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), np.float32)
+        if key in self._exact:  # stored concurrently by another thread
+            self._responses[self._exact[key]] = response
+            return
+
+        if self._size < self.max_entries:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = int(np.argmin(self._last_used))
+            del self._exact[self._keys[slot]]
+            evicted_id = int(self._namespace_ids[slot])
+            self._namespace_sizes[evicted_id] -= 1
+            if self.use_ann:
+                self._ann_remove(slot, evicted_id)
+
+        namespace_id = self._namespaces.setdefault(namespace, len(self._namespaces))
+        self._namespace_sizes[namespace_id] = (
+            self._namespace_sizes.get(namespace_id, 0) + 1
+        )
+        self._vectors[slot] = vector
+        self._namespace_ids[slot] = namespace_id
+        self._responses[slot] = response
+        self._keys[slot] = key
+        self._exact[key] = slot
+        self._touch(slot)
+        if self.use_ann:
+            self._ann_add(slot, vector, namespace_id)
+
+    def lookup(
+        self, prompt: str, namespace: str = "", template: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Looks up the cached response of a prompt or a near-identical prompt.
+
+        Args:
+            prompt (str): The prompt to look up.
+            namespace (str, optional): Namespace the prompt belongs to. Defaults to "".
+            template (str, optional): Template name selecting the threshold. Defaults to None.
+
+        Returns:
+            str: The cached response, or None on a cache miss.
+        """
+        text = normalize_prompt(prompt)
+        with self._lock:
+            slot = self._exact.get(self._exact_key(text, namespace))
+            if slot is not None:
+                return self._touch(slot)
+        vector = self._embed(text)
+        with self._lock:
+            return self._search(
+                vector, namespace, self.thresholds.get(template, self.threshold)
+            )
+
+    def store(self, prompt: str, response: str, namespace: str = "") -> None:
+        """
+        Adds a prompt and its response to the cache.
+
+        Args:
+            prompt (str): The prompt.
+            response (str): The response to return for this and similar prompts.
+            namespace (str, optional): Namespace the prompt belongs to. Defaults to "".
+        """
+        text = normalize_prompt(prompt)
+        vector = self._embed(text)
+        with self._lock:
+            self._insert(self._exact_key(text, namespace), vector, response, namespace)
+
+    def get_chat_response(
+        self,
+        prompt: str,
+        sys_message: str = "",
+        model: str = "gpt-3.5-turbo",
+        template: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Generates a chat response, answering near-identical prompts from the cache.
+
+        Args:
+            prompt (str): The message from the user.
+            sys_message (str, optional): A system message for the LLM. Defaults to an empty string.
+            model (str, optional): The name of the OpenAI model to use. Defaults to "gpt-3.5-turbo".
+            template (str, optional): Name of the prompt template, used to separate cache
+                entries and to select the similarity threshold. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to `get_chat_response`.
+
+        Returns:
+            str: The cached or newly generated response.
+
+        Raises:
+            ChatAPIResponseException: For errors during the response processing.
+        """
+        namespace = repr((template, model, sys_message, sorted(kwargs.items())))
+        text = normalize_prompt(prompt)
+        key = self._exact_key(text, namespace)
+
+        with self._lock:
+            slot = self._exact.get(key)
+            if slot is not None:
+                self.hits += 1
+                return self._touch(slot)
+
+        vector = self._embed(text)
+        threshold = self.thresholds.get(template, self.threshold)
+        with self._lock:
+            response = self._search(vector, namespace, threshold)
+            if response is not None:
+                self.hits += 1
+                return response
+            self.misses += 1
+
+        response = get_chat_response(
+            prompt, sys_message=sys_message, model=model, **kwargs
+        )
+        with self._lock:
+            self._insert(key, vector, response, namespace)
+        logging.info("Cached chat response (%d entries).", self._size)
+        return response
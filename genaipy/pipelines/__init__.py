@@ -0,0 +1 @@
+"""Module with end-to-end pipelines combining extractors, prompts and chat APIs."""
@@ -0,0 +1,266 @@
+"""Module for batch summarization of PDF documents with the map-reduce technique."""
+
+import hashlib
+import logging
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional
+
+from genaipy.extractors.pdf import extract_pages_text
+from genaipy.openai_apis.chat import HedgingPolicy, ModelRouter, get_chat_response
+from genaipy.prompts.build_prompt import build_prompt
+from genaipy.prompts.generate_summaries import (
+    DEFAULT_SYS_MESSAGE,
+    SUMMARY_PROMPT_TPL,
+    REDUCE_SUMMARY_PROMPT_TPL,
+)
+from genaipy.utilities import write_string_to_txt
+from genaipy.utilities.tracing import traced
+
+
+@traced("summarize_map")
+def summarize_map(
+    text: str,
+    max_words: int,
+    model: str,
+    sys_message: str = DEFAULT_SYS_MESSAGE,
+    router: Optional[ModelRouter] = None,
+    hedging: Optional[HedgingPolicy] = None,
+) -> str:
+    """
+    Generates the map summary of a single page text.
+
+    Args:
+        text (str): The page text to summarize.
+        max_words (int): Maximum number of words of the summary.
+        model (str): The name of the OpenAI model to use.
+        sys_message (str, optional): The system message. Defaults to `DEFAULT_SYS_MESSAGE`.
+        router (ModelRouter, optional): Router choosing the model for the "map" task
+            instead of `model`. Defaults to None.
+        hedging (HedgingPolicy, optional): Policy for hedging slow requests.
+            Defaults to None.
+
+    Returns:
+        str: The map summary.
+    """
+    map_prompt = build_prompt(
+        template=SUMMARY_PROMPT_TPL, text=text, max_words=max_words
+    )
+    return get_chat_response(
+        map_prompt,
+        sys_message=sys_message,
+        model=model,
+        router=router,
+        task="map",
+        hedging=hedging,
+    )
+
+
+@traced("summarize_reduce")
+def summarize_reduce(
+    map_summaries: List[str],
+    max_words: int,
+    model: str,
+    sys_message: str = DEFAULT_SYS_MESSAGE,
+    router: Optional[ModelRouter] = None,
+) -> str:
+    """
+    Distills a list of map summaries into one final summary.
+
+    Args:
+        map_summaries (List[str]): The map summaries in page order.
+        max_words (int): Maximum number of words of the final summary.
+        model (str): The name of the OpenAI model to use.
+        sys_message (str, optional): The system message. Defaults to `DEFAULT_SYS_MESSAGE`.
+        router (ModelRouter, optional): Router choosing the model for the "reduce" task
+            instead of `model`. Defaults to None.
+
+    Returns:
+        str: The final summary.
+    """
+    text = "\n".join(map_summaries).replace("\n\n", "")
+    reduce_prompt = build_prompt(
+        template=REDUCE_SUMMARY_PROMPT_TPL, text=text, max_words=max_words
+    )
+    return get_chat_response(
+        prompt=reduce_prompt,
+        sys_message=sys_message,
+        model=model,
+        router=router,
+        task="reduce",
+        max_tokens=1024,
+    )
+
+
+def _output_paths(output_dir: str, pdf_paths: List[str]) -> Dict[str, str]:
+    """
+    Derives the output text file path of every PDF document.
+
+    Documents with a unique file name get `<name>_summary.txt`. Documents sharing a
+    file name, e.g. `a/report.pdf` and `b/report.pdf`, get a short hash of their
+    absolute path appended, so each name only depends on the input path.
+    """
+    stems = {
+        pdf_path: os.path.splitext(os.path.basename(pdf_path))[0]
+        for pdf_path in pdf_paths
+    }
+    stem_counts = Counter(stems.values())
+    file_paths = {}
+    for pdf_path, stem in stems.items():
+        if stem_counts[stem] > 1:
+            digest = hashlib.sha256(
+                os.path.abspath(pdf_path).encode("utf-8")
+            ).hexdigest()[:8]
+            stem = f"{stem}_{digest}"
+        file_paths[pdf_path] = os.path.join(output_dir, f"{stem}_summary.txt")
+    return file_paths
+
+
+def summarize_documents(
+    pdf_paths: Iterable[str],
+    output_dir: Optional[str] = None,
+    start_page: Optional[int] = None,
+    end_page: Optional[int] = None,
+    map_model: str = "gpt-3.5-turbo",
+    reduce_model: str = "gpt-4-1106-preview",
+    map_max_words: int = 150,
+    reduce_max_words: int = 350,
+    sys_message: str = DEFAULT_SYS_MESSAGE,
+    max_workers: int = 8,
+    router: Optional[ModelRouter] = None,
+    hedging: Optional[HedgingPolicy] = None,
+    max_documents: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Summarizes many PDF documents with the map-reduce technique.
+
+    Extraction, map and reduce calls of all documents are scheduled on one shared
+    thread pool, so map calls of large documents fill workers that small documents
+    leave idle. The next document is only extracted once fewer than `max_documents`
+    documents are being extracted or mapped, which bounds the page texts held in
+    memory and lets map calls start right away. A failing document is logged and
+    skipped without stopping the batch.
+
+    Args:
+        pdf_paths (Iterable[str]): Paths of the PDF files to summarize.
+        output_dir (str, optional): Folder to write one `<name>_summary.txt` file per
+            document to. Documents sharing a file name get a short hash of their
+            path appended. If not specified, no files are written.
+        start_page (int, optional): The starting page number for every document.
+        end_page (int, optional): The ending page number for every document.
+        map_model (str, optional): Model for the map summaries. Defaults to "gpt-3.5-turbo".
+        reduce_model (str, optional): Model for the final summaries.
+            Defaults to "gpt-4-1106-preview".
+        map_max_words (int, optional): Maximum words per map summary. Defaults to 150.
+        reduce_max_words (int, optional): Maximum words per final summary. Defaults to 350.
+        sys_message (str, optional): The system message. Defaults to `DEFAULT_SYS_MESSAGE`.
+        max_workers (int, optional): Size of the shared thread pool. Defaults to 8.
+        router (ModelRouter, optional): Router choosing the model per map and reduce
+            call. Overrides `map_model` and `reduce_model`. Defaults to None.
+        hedging (HedgingPolicy, optional): Policy hedging straggling map calls with a
+            duplicate request. Defaults to None.
+        max_documents (int, optional): Maximum number of documents being extracted or
+            mapped at the same time. Defaults to `max_workers`.
+
+    Returns:
+        Dict[str, str]: A dictionary mapping each successfully summarized PDF path to
+        its final summary.
+    """
+    pdf_paths = list(dict.fromkeys(pdf_paths))  # drop repeated paths
+    max_documents = max_documents or max_workers
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        file_paths = _output_paths(output_dir, pdf_paths)
+
+    summaries = {}
+    map_results = {}  # pdf path -> list of map summaries in page order
+    remaining = {}  # pdf path -> number of outstanding map calls
+    in_flight = set()  # documents being extracted or mapped
+    failed = set()
+    queued_paths = iter(pdf_paths)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}  # future -> (stage, pdf path, index)
+
+        def submit_extractions():
+            while len(in_flight) < max_documents:
+                pdf_path = next(queued_paths, None)
+                if pdf_path is None:
+                    return
+                future = executor.submit(
+                    extract_pages_text,
+                    pdf_path=pdf_path,
+                    start_page=start_page,
+                    end_page=end_page,
+                )
+                pending[future] = ("extract", pdf_path, None)
+                in_flight.add(pdf_path)
+
+        submit_extractions()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, pdf_path, index = pending.pop(future)
+                if pdf_path in failed:
+                    continue
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logging.error("Failed %s stage for '%s': %s", stage, pdf_path, e)
+                    failed.add(pdf_path)
+                    in_flight.discard(pdf_path)
+                    map_results.pop(pdf_path, None)
+                    for other, (_, other_path, _) in pending.items():
+                        if other_path == pdf_path:
+                            other.cancel()  # skip queued map calls of failed document
+                    continue
+
+                if stage == "extract":
+                    if not result:
+                        logging.warning("No text extracted from '%s'.", pdf_path)
+                        failed.add(pdf_path)
+                        in_flight.discard(pdf_path)
+                        continue
+                    logging.info("Loaded %d pages from '%s'.", len(result), pdf_path)
+                    map_results[pdf_path] = [None] * len(result)
+                    remaining[pdf_path] = len(result)
+                    for idx, key in enumerate(sorted(result)):
+                        map_future = executor.submit(
+                            summarize_map,
+                            result[key]["content"],
+                            map_max_words,
+                            map_model,
+                            sys_message,
+                            router,
+                            hedging,
+                        )
+                        pending[map_future] = ("map", pdf_path, idx)
+
+                elif stage == "map":
+                    map_results[pdf_path][index] = result
+                    remaining[pdf_path] -= 1
+                    if remaining[pdf_path] == 0:
+                        in_flight.discard(pdf_path)
+                        reduce_future = executor.submit(
+                            summarize_reduce,
+                            map_results.pop(pdf_path),
+                            reduce_max_words,
+                            reduce_model,
+                            sys_message,
+                            router,
+                        )
+                        pending[reduce_future] = ("reduce", pdf_path, None)
+
+                else:
+                    summaries[pdf_path] = result
+                    logging.info("Final summary created for '%s'.", pdf_path)
+                    if output_dir is not None:
+                        write_string_to_txt(
+                            text=result.strip(), file_path=file_paths[pdf_path]
+                        )
+            submit_extractions()
+
+    logging.info("Summarized %d of %d documents.", len(summaries), len(pdf_paths))
+    return summaries
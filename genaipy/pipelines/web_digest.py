@@ -0,0 +1,197 @@
+"""Module for summarizing lists of webpages with overlapped streaming stages."""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from genaipy.extractors.web import extract_tags_from_html, fetch_html
+from genaipy.openai_apis.chat import get_chat_response
+from genaipy.outlines.article_summary_outline import ARTICLE_SUMMARY_OUTLINE
+from genaipy.prompts.style_texts import build_style_prompt
+from genaipy.utilities import write_string_to_txt
+
+_STOP = object()
+
+
+def _start_stage(
+    name: str,
+    func: Callable,
+    in_queue: queue.Queue,
+    out_queue: Optional[queue.Queue],
+    num_workers: int,
+) -> List[threading.Thread]:
+    """
+    Starts worker threads applying a function to every item of a queue.
+
+    Results other than None are put on the output queue. Failing items are logged
+    and dropped. Once all workers have seen the stop marker, it is passed on to the
+    next stage.
+    """
+    remaining = [num_workers]
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            item = in_queue.get()
+            if item is _STOP:
+                in_queue.put(_STOP)  # let sibling workers stop as well
+                break
+            try:
+                result = func(item)
+            except Exception as e:
+                logging.error("Error in %s stage: %s", name, e)
+                continue
+            if result is not None and out_queue is not None:
+                out_queue.put(result)
+
+        with lock:
+            remaining[0] -= 1
+            last_worker = remaining[0] == 0
+        if last_worker and out_queue is not None:
+            out_queue.put(_STOP)
+
+    threads = [
+        threading.Thread(target=worker, name=f"{name}-{idx}", daemon=True)
+        for idx in range(num_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def _load_state(state_path: Optional[str]) -> Dict[str, str]:
+    """Loads the URL to content hash mapping of the previous run."""
+    if not state_path or not os.path.isfile(state_path):
+        return {}
+    with open(state_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _save_state(state_path: str, state: Dict[str, str]) -> None:
+    """Saves the URL to content hash mapping for the next run."""
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(state, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
+def url_to_filename(url: str) -> str:
+    """Derives a readable, unique text file name from a URL."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", url.split("://", 1)[-1]).strip("_")[:80]
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}_{digest}.txt"
+
+
+def summarize_urls(
+    urls: Iterable[str],
+    tags: Optional[list] = None,
+    outline: str = ARTICLE_SUMMARY_OUTLINE,
+    model: str = "gpt-3.5-turbo",
+    sys_message: str = "",
+    state_path: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    fetch_workers: int = 8,
+    extract_workers: int = 2,
+    chat_workers: int = 4,
+    queue_size: int = 16,
+    **kwargs: Any,
+) -> Dict[str, str]:
+    """
+    Fetches, extracts and summarizes webpages into a filled outline.
+
+    Fetching, HTML extraction and chat requests run as overlapped stages with their
+    own worker threads, connected by bounded queues so fast stages cannot run ahead
+    of slow ones without limit. Pages whose extracted text and summary settings
+    (tags, outline, model, system message and request options) are unchanged since
+    the last run recorded in `state_path` are skipped before any chat request. The
+    state is saved after every summarized page, so an interrupted run resumes where
+    it stopped.
+
+    Args:
+        urls (Iterable[str]): The URLs of the webpages.
+        tags (list, optional): HTML tags to extract content from. Defaults to ["p", "h1"].
+        outline (str, optional): The outline to fill. Defaults to `ARTICLE_SUMMARY_OUTLINE`.
+        model (str, optional): The name of the OpenAI model to use. Defaults to "gpt-3.5-turbo".
+        sys_message (str, optional): A system message for the LLM. Defaults to an empty string.
+        state_path (str, optional): JSON file with content hashes of the previous run,
+            updated after every summarized page. If not specified, every URL is
+            summarized.
+        output_dir (str, optional): Folder to write one text file per summary to.
+            If not specified, no files are written.
+        fetch_workers (int, optional): Number of fetch threads. Defaults to 8.
+        extract_workers (int, optional): Number of extraction threads. Defaults to 2.
+        chat_workers (int, optional): Number of concurrent chat requests. Defaults to 4.
+        queue_size (int, optional): Capacity of the queues between stages. Defaults to 16.
+        **kwargs: Additional keyword arguments to pass to `get_chat_response`.
+
+    Returns:
+        Dict[str, str]: A dictionary mapping each newly summarized URL to its summary.
+    """
+    tags = tags or ["p", "h1"]
+    state = _load_state(state_path)
+    previous_state = dict(state)
+    # Objects such as routers cannot be serialized stably, only their type counts
+    settings = json.dumps(
+        [tags, outline, model, sys_message, kwargs],
+        sort_keys=True,
+        default=lambda value: type(value).__name__,
+    )
+    summaries = {}
+    results_lock = threading.Lock()
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    def fetch(url):
+        return url, fetch_html(url)
+
+    def extract(item):
+        url, html = item
+        text = extract_tags_from_html(html, tags)
+        digest = hashlib.sha256(f"{settings}\0{text}".encode("utf-8")).hexdigest()
+        if previous_state.get(url) == digest:
+            logging.info("Skipping unchanged page: %s", url)
+            return None
+        return url, text, digest
+
+    def summarize(item):
+        url, text, digest = item
+        prompt = build_style_prompt(text=f"Source: {url}\n\n{text}", tpl=outline)
+        summary = get_chat_response(
+            prompt, sys_message=sys_message, model=model, **kwargs
+        )
+        if output_dir is not None:
+            write_string_to_txt(
+                text=summary.strip(),
+                file_path=os.path.join(output_dir, url_to_filename(url)),
+            )
+        with results_lock:
+            summaries[url] = summary
+            if state_path:
+                state[url] = digest
+                _save_state(state_path, state)
+        logging.info("Summarized page: %s", url)
+
+    url_queue = queue.Queue(maxsize=queue_size)
+    html_queue = queue.Queue(maxsize=queue_size)
+    text_queue = queue.Queue(maxsize=queue_size)
+    threads = (
+        _start_stage("fetch", fetch, url_queue, html_queue, fetch_workers)
+        + _start_stage("extract", extract, html_queue, text_queue, extract_workers)
+        + _start_stage("summarize", summarize, text_queue, None, chat_workers)
+    )
+
+    num_urls = 0
+    for url in urls:
+        url_queue.put(url)
+        num_urls += 1
+    url_queue.put(_STOP)
+    for thread in threads:
+        thread.join()
+
+    logging.info("Summarized %d of %d pages.", len(summaries), num_urls)
+    return summaries
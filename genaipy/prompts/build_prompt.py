@@ -2,7 +2,10 @@
 
 import logging
 
+from genaipy.utilities.tracing import traced
 
+
+@traced("build_prompt")
 def build_prompt(template: str, **kwargs) -> str:
     """Builds a prompt from a template and provided keyword arguments.
 
@@ -26,3 +26,14 @@ Make sure that the final summary is coherent and clearly structured by using hea
 
 Final summary:
 """
+
+CONVERSATION_SUMMARY_PROMPT_TPL = """
+Conversation:
+```{text}```
+
+Instructions:
+Your task is to condense the provided conversation, delimited by triple back ticks, into a summary in at most {max_words} words.
+Keep all facts, decisions, and open questions that are needed to continue the conversation.
+
+Summary:
+"""
@@ -1,9 +1,29 @@
 """Module with helper functions assisting in library functionality."""
 
-# Importing submodules for easy access
-from .file_operations import write_string_to_txt, write_data_to_jsonl
-from .api_auth import validate_api_key
-from .data_conversions import convert_json_to_df, convert_df_to_messages
+import importlib
+
+# Submodules are imported on first access, so heavy dependencies like pandas
+# are only loaded by callers that use the helpers requiring them.
+_LAZY_ATTRIBUTES = {
+    "write_string_to_txt": "file_operations",
+    "write_data_to_jsonl": "file_operations",
+    "validate_api_key": "api_auth",
+    "convert_json_to_df": "data_conversions",
+    "convert_df_to_messages": "data_conversions",
+    "count_tokens": "token_counting",
+    "count_message_tokens": "token_counting",
+    "NearDuplicateIndex": "deduplication",
+    "deduplicate_pages": "deduplication",
+    "deduplicate_records": "deduplication",
+    "DatasetBuilder": "dataset_builder",
+    "iter_dataset_records": "dataset_builder",
+    "enable_tracing": "tracing",
+    "span": "tracing",
+    "traced": "tracing",
+    "get_stage_summary": "tracing",
+    "format_stage_summary": "tracing",
+    "write_chrome_trace": "tracing",
+}
 
 __all__ = [
     "write_string_to_txt",
@@ -11,4 +31,31 @@ __all__ = [
     "validate_api_key",
     "convert_json_to_df",
     "convert_df_to_messages",
+    "count_tokens",
+    "count_message_tokens",
+    "NearDuplicateIndex",
+    "deduplicate_pages",
+    "deduplicate_records",
+    "DatasetBuilder",
+    "iter_dataset_records",
+    "enable_tracing",
+    "span",
+    "traced",
+    "get_stage_summary",
+    "format_stage_summary",
+    "write_chrome_trace",
 ]
+
+
+def __getattr__(name: str):
+    """Imports the submodule providing a helper on first attribute access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,10 @@ import json
 import logging
 import pandas as pd
 
+from genaipy.utilities.tracing import traced
 
+
+@traced("convert_json_to_df")
 def convert_json_to_df(json_str: str) -> pd.DataFrame:
     """
     Converts a JSON string to a pandas DataFrame.
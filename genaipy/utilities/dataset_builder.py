@@ -0,0 +1,304 @@
+"""Submodule for streaming fine-tuning datasets into sharded JSON Lines files."""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from genaipy.utilities.token_counting import count_message_tokens
+from genaipy.utilities.tracing import traced
+
+SPLITS = ("train", "validation")
+
+
+@traced("write_dataset_shard")
+def _write_shard(
+    file_path: str,
+    lines: List[str],
+    records: List[dict],
+    encoding_name: Optional[str],
+) -> Dict[str, Any]:
+    """Writes the lines of a shard and returns its token statistics."""
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+    tokens = [
+        count_message_tokens(record["messages"], encoding_name) for record in records
+    ]
+    return {
+        "num_tokens": sum(tokens),
+        "min_tokens": min(tokens),
+        "max_tokens": max(tokens),
+        "mean_tokens": sum(tokens) / len(tokens),
+    }
+
+
+class DatasetBuilder:
+    """
+    Streams chat fine-tuning records into size-bounded JSON Lines shards.
+
+    Records are assigned to the train or validation split by a hash of their
+    content, so the split is reproducible across runs and identical records always
+    land in the same split. Once a split's buffer reaches `max_shard_bytes`, the
+    shard is written and its token statistics are computed in a worker thread
+    while further records are added. `close` writes the remaining shards and a
+    `manifest.json` describing every shard and split. A folder therefore only has a
+    manifest once a build completed: the manifest and shards of a previous build with
+    the same prefix are removed on start, and no manifest is written if the `with`
+    block raises or `abort` is called.
+
+    Args:
+        output_dir (str): Folder for the shards and the manifest.
+        max_shard_bytes (int, optional): Maximum size of a shard in bytes.
+            Defaults to 100 MiB.
+        validation_ratio (float, optional): Fraction of records assigned to the
+            validation split. Defaults to 0.1.
+        max_workers (int, optional): Number of shards written concurrently.
+            Defaults to 4.
+        prefix (str, optional): Prefix of the shard file names. Defaults to "dataset".
+        encoding_name (str, optional): tiktoken encoding for the token statistics.
+            Defaults to "cl100k_base". Pass None to use the character based estimate.
+
+    Raises:
+        ValueError: If `max_shard_bytes` is not positive or `validation_ratio` is
+            not between 0 and 1.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        max_shard_bytes: int = 100 * 2**20,
+        validation_ratio: float = 0.1,
+        max_workers: int = 4,
+        prefix: str = "dataset",
+        encoding_name: Optional[str] = "cl100k_base",
+    ):
+        if max_shard_bytes <= 0:
+            raise ValueError("max_shard_bytes must be positive.")
+        if not 0 <= validation_ratio <= 1:
+            raise ValueError("validation_ratio must be between 0 and 1.")
+
+        self.output_dir = output_dir
+        self.max_shard_bytes = max_shard_bytes
+        self.validation_ratio = validation_ratio
+        self.max_workers = max_workers
+        self.prefix = prefix
+        self.encoding_name = encoding_name
+        os.makedirs(output_dir, exist_ok=True)
+        self._manifest_path = os.path.join(output_dir, "manifest.json")
+        self._remove_previous_build()
+
+        self._buffers = {split: ([], [], 0) for split in SPLITS}
+        self._shard_counts = dict.fromkeys(SPLITS, 0)
+        self._shards = []
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._manifest = None
+        self._aborted = False
+
+    def _remove_previous_build(self) -> None:
+        """Deletes the manifest and the shards a previous build left in the folder."""
+        if os.path.exists(self._manifest_path):
+            os.remove(self._manifest_path)
+        shard_digits = "[0-9]" * 5
+        for split in SPLITS:
+            pattern = f"{glob.escape(self.prefix)}-{split}-{shard_digits}.jsonl"
+            directory = glob.escape(self.output_dir)
+            for file_path in glob.glob(os.path.join(directory, pattern)):
+                os.remove(file_path)
+
+    def _assign_split(self, line: str) -> str:
+        """Maps a serialized record to a split by a hash of its content."""
+        digest = hashlib.blake2b(line.encode("utf-8"), digest_size=8).digest()
+        fraction = int.from_bytes(digest, "big") / 2**64
+        return "validation" if fraction < self.validation_ratio else "train"
+
+    def add(self, record: dict) -> str:
+        """
+        Adds a record in chat fine-tuning format to the dataset.
+
+        Args:
+            record (dict): A dictionary with a "messages" list of chat messages.
+
+        Returns:
+            str: The split the record was assigned to.
+
+        Raises:
+            ValueError: If the record has no "messages" list or the builder is closed.
+        """
+        if self._manifest is not None or self._aborted:
+            raise ValueError("Cannot add records to a closed DatasetBuilder.")
+        if not isinstance(record.get("messages"), list):
+            raise ValueError("Record must contain a 'messages' list.")
+
+        line = json.dumps(record) + "\n"
+        split = self._assign_split(line)
+        lines, records, num_bytes = self._buffers[split]
+        if lines and num_bytes + len(line) > self.max_shard_bytes:
+            self._flush(split)
+            lines, records, num_bytes = self._buffers[split]
+        lines.append(line)
+        records.append(record)
+        self._buffers[split] = (lines, records, num_bytes + len(line))
+        return split
+
+    def add_pair(self, user_msg: str, assistant_msg: str, system_msg: str = "") -> str:
+        """
+        Adds a user and assistant message pair to the dataset.
+
+        Args:
+            user_msg (str): The user message, e.g. a question.
+            assistant_msg (str): The assistant message, e.g. the answer.
+            system_msg (str, optional): A system message. Defaults to an empty string,
+                in which case no system message is included.
+
+        Returns:
+            str: The split the record was assigned to.
+        """
+        messages = [{"role": "system", "content": system_msg}] if system_msg else []
+        messages += [
+            {"role": "user", "content": user_msg},
+            {"role": "assistant", "content": assistant_msg},
+        ]
+        return self.add({"messages": messages})
+
+    def _flush(self, split: str) -> None:
+        """Hands the buffered records of a split to a worker thread for writing."""
+        lines, records, num_bytes = self._buffers[split]
+        if not lines:
+            return
+        self._buffers[split] = ([], [], 0)
+
+        # Bound the shards held in memory while workers are busy writing
+        while len(self._pending) >= 2 * self.max_workers:
+            self._collect(wait(self._pending, return_when=FIRST_COMPLETED).done)
+
+        file_name = f"{self.prefix}-{split}-{self._shard_counts[split]:05d}.jsonl"
+        self._shard_counts[split] += 1
+        shard = {
+            "file": file_name,
+            "split": split,
+            "num_records": len(lines),
+            "num_bytes": num_bytes,
+        }
+        future = self._executor.submit(
+            _write_shard,
+            os.path.join(self.output_dir, file_name),
+            lines,
+            records,
+            self.encoding_name,
+        )
+        self._pending[future] = shard
+
+    def _collect(self, futures) -> None:
+        """Records the statistics of written shards."""
+        for future in futures:
+            shard = self._pending.pop(future)
+            try:
+                shard.update(future.result())
+            except Exception as e:
+                logging.error("Error writing dataset shard '%s': %s", shard["file"], e)
+                raise
+            self._shards.append(shard)
+            logging.info(
+                "Dataset shard '%s' written with %d records.",
+                shard["file"],
+                shard["num_records"],
+            )
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Writes the remaining shards and the manifest.
+
+        Returns:
+            Dict[str, Any]: The manifest with the statistics of every shard and split.
+
+        Raises:
+            ValueError: If the build was aborted.
+            Exception: If an error occurs during writing a shard or the manifest.
+        """
+        if self._manifest is not None:
+            return self._manifest
+        if self._aborted:
+            raise ValueError("Cannot close an aborted DatasetBuilder.")
+        try:
+            for split in SPLITS:
+                self._flush(split)
+            self._collect(list(self._pending))
+        finally:
+            self._executor.shutdown(wait=True)
+
+        shards = sorted(self._shards, key=lambda shard: shard["file"])
+        splits = {}
+        for split in SPLITS:
+            split_shards = [shard for shard in shards if shard["split"] == split]
+            splits[split] = {
+                "num_shards": len(split_shards),
+                "num_records": sum(shard["num_records"] for shard in split_shards),
+                "num_bytes": sum(shard["num_bytes"] for shard in split_shards),
+                "num_tokens": sum(shard["num_tokens"] for shard in split_shards),
+            }
+        self._manifest = {
+            "max_shard_bytes": self.max_shard_bytes,
+            "validation_ratio": self.validation_ratio,
+            "splits": splits,
+            "shards": shards,
+        }
+
+        with open(self._manifest_path, "w", encoding="utf-8") as file:
+            json.dump(self._manifest, file, indent=2)
+        logging.info(
+            "Dataset with %d train and %d validation records written to '%s'",
+            splits["train"]["num_records"],
+            splits["validation"]["num_records"],
+            self.output_dir,
+        )
+        return self._manifest
+
+    def abort(self) -> None:
+        """Stops the build without writing buffered records or a manifest."""
+        if self._manifest is not None or self._aborted:
+            return
+        self._aborted = True
+        self._buffers = {split: ([], [], 0) for split in SPLITS}
+        self._executor.shutdown(wait=True)
+        self._pending.clear()
+        logging.warning(
+            "Dataset build in '%s' aborted, no manifest written.", self.output_dir
+        )
+
+    def __enter__(self) -> "DatasetBuilder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def iter_dataset_records(
+    output_dir: str, split: Optional[str] = None
+) -> Iterator[Tuple[str, dict]]:
+    """
+    Iterates the records of a dataset written by `DatasetBuilder`.
+
+    Args:
+        output_dir (str): Folder with the shards and the manifest.
+        split (str, optional): Only yield records of this split. Defaults to all splits.
+
+    Yields:
+        Tuple[str, dict]: The split and the record.
+    """
+    with open(os.path.join(output_dir, "manifest.json"), "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+    for shard in manifest["shards"]:
+        if split is not None and shard["split"] != split:
+            continue
+        with open(
+            os.path.join(output_dir, shard["file"]), "r", encoding="utf-8"
+        ) as file:
+            for line in file:
+                yield shard["split"], json.loads(line)
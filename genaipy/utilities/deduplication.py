@@ -0,0 +1,216 @@
+"""Submodule for near-duplicate detection with MinHash signatures and LSH."""
+
+import logging
+import random
+import re
+import zlib
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple, Union
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NON_WORD_RE = re.compile(r"\W+")
+
+
+def shingle_text(text: str, shingle_size: int = 5) -> Set[int]:
+    """
+    Splits a text into hashed word shingles after normalizing case and punctuation.
+
+    Args:
+        text (str): The text to shingle.
+        shingle_size (int, optional): Number of words per shingle. Defaults to 5.
+
+    Returns:
+        Set[int]: The set of 32-bit shingle hashes.
+    """
+    words = _NON_WORD_RE.sub(" ", text.lower()).split()
+    if len(words) <= shingle_size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))}
+    return {
+        zlib.crc32(" ".join(words[idx : idx + shingle_size]).encode("utf-8"))
+        for idx in range(len(words) - shingle_size + 1)
+    }
+
+
+def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Chooses bands and rows per band whose LSH S-curve crosses the threshold."""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    Index finding near-duplicate texts by estimated Jaccard similarity of shingles.
+
+    Texts are reduced to MinHash signatures and bucketed by locality-sensitive
+    hashing, so lookups only compare against a few candidates instead of every
+    indexed text.
+
+    Args:
+        threshold (float, optional): Minimum estimated Jaccard similarity of two texts
+            to count as near-duplicates. Defaults to 0.8.
+        num_perm (int, optional): Number of MinHash permutations. Defaults to 64.
+        shingle_size (int, optional): Number of words per shingle. Defaults to 5.
+        seed (int, optional): Seed of the hash permutations. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in the interval (0, 1].")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _optimal_bands(threshold, num_perm)
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures = {}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """Computes the MinHash signature of a text."""
+        shingles = shingle_text(text, self.shingle_size)
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in shingles)
+            for a, b in self._perms
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows]
+
+    def query(self, text: str) -> Optional[Hashable]:
+        """
+        Finds an indexed near-duplicate of a text.
+
+        Args:
+            text (str): The text to look up.
+
+        Returns:
+            Hashable: The key of the most similar indexed text above the threshold,
+            or None if there is none.
+        """
+        return self._query_signature(self.signature(text))
+
+    def _query_signature(self, signature: Tuple[int, ...]) -> Optional[Hashable]:
+        candidates = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        best_key, best_similarity = None, 0.0
+        for key in candidates:
+            other = self._signatures[key]
+            similarity = sum(x == y for x, y in zip(signature, other)) / self.num_perm
+            if similarity >= self.threshold and similarity > best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+    def add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """
+        Adds a text to the index unless it is a near-duplicate of an indexed text.
+
+        Args:
+            key (Hashable): Unique key identifying the text.
+            text (str): The text to add.
+
+        Returns:
+            Hashable: The key of the near-duplicate if one exists (the text is then not
+            added), otherwise None.
+        """
+        signature = self.signature(text)
+        duplicate = self._query_signature(signature)
+        if duplicate is not None:
+            return duplicate
+
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+def deduplicate_pages(
+    pages: Dict[int, Dict[str, Union[int, str]]], threshold: float = 0.9, **kwargs
+) -> Dict[int, Dict[str, Union[int, str]]]:
+    """
+    Removes pages whose content is a near-duplicate of an earlier page.
+
+    Args:
+        pages (Dict[int, Dict[str, Union[int, str]]]): Pages as returned by
+            `extract_pages_text`.
+        threshold (float, optional): Minimum estimated Jaccard similarity to count as
+            a duplicate. Defaults to 0.9.
+        **kwargs: Additional keyword arguments passed to `NearDuplicateIndex`.
+
+    Returns:
+        Dict[int, Dict[str, Union[int, str]]]: The unique pages in the same format,
+        renumbered with sequential keys starting from 1.
+    """
+    index = NearDuplicateIndex(threshold=threshold, **kwargs)
+    unique_pages = {}
+    for key in sorted(pages):
+        page = pages[key]
+        duplicate = index.add(page["page_number"], page["content"])
+        if duplicate is not None:
+            logging.info(
+                "Skipping page %d as near-duplicate of page %d.",
+                page["page_number"],
+                duplicate,
+            )
+            continue
+        unique_pages[len(unique_pages) + 1] = page
+
+    logging.info(
+        "Kept %d of %d pages after deduplication.", len(unique_pages), len(pages)
+    )
+    return unique_pages
+
+
+def deduplicate_records(
+    records: List[dict], keys: Sequence[str], threshold: float = 0.9, **kwargs
+) -> List[dict]:
+    """
+    Removes records whose values for given keys are near-duplicates of an earlier record.
+
+    Args:
+        records (List[dict]): Records, e.g. generated question-answer pairs.
+        keys (Sequence[str]): Keys whose values are compared, e.g. ("question", "answer").
+        threshold (float, optional): Minimum estimated Jaccard similarity to count as
+            a duplicate. Defaults to 0.9.
+        **kwargs: Additional keyword arguments passed to `NearDuplicateIndex`.
+
+    Returns:
+        List[dict]: The unique records in their original order.
+
+    Raises:
+        KeyError: If a record does not contain one of the keys.
+    """
+    index = NearDuplicateIndex(threshold=threshold, **kwargs)
+    unique_records = []
+    for idx, record in enumerate(records):
+        text = "\n".join(str(record[key]) for key in keys)
+        if index.add(idx, text) is None:
+            unique_records.append(record)
+
+    logging.info(
+        "Kept %d of %d records after deduplication.", len(unique_records), len(records)
+    )
+    return unique_records
@@ -3,6 +3,8 @@
 import json
 import logging
 
+from genaipy.utilities.tracing import traced
+
 
 def write_string_to_txt(text: str, file_path: str = "output.txt") -> bool:
     """
@@ -30,6 +32,7 @@ def write_string_to_txt(text: str, file_path: str = "output.txt") -> bool:
         raise
 
 
+@traced("write_data_to_jsonl")
 def write_data_to_jsonl(data: list, file_path: str = "output.jsonl") -> None:
     """
     Writes a list of dictionaries to a JSON Lines format file.
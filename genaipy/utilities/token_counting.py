@@ -0,0 +1,60 @@
+"""Submodule for estimating token counts of texts and chat messages."""
+
+from functools import lru_cache
+from typing import List, Optional
+
+CHARS_PER_TOKEN = 4  # Rule of thumb for English text with OpenAI tokenizers
+TOKENS_PER_MESSAGE = 4  # Overhead of role and delimiters per chat message
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str):
+    """Returns the tiktoken encoding if tiktoken is installed, otherwise None."""
+    try:
+        import tiktoken  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return tiktoken.get_encoding(encoding_name)
+
+
+def count_tokens(text: str, encoding_name: Optional[str] = "cl100k_base") -> int:
+    """
+    Counts the tokens of a text.
+
+    Uses `tiktoken` for exact counts if it is installed and falls back to a fast
+    character based estimate otherwise.
+
+    Args:
+        text (str): The text to count tokens for.
+        encoding_name (str, optional): Name of the tiktoken encoding.
+            Defaults to "cl100k_base". Pass None to always use the estimate.
+
+    Returns:
+        int: The (estimated) number of tokens.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(encoding_name) if encoding_name else None
+    if encoding is None:
+        return max(1, len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
+
+
+def count_message_tokens(
+    messages: List[dict], encoding_name: Optional[str] = "cl100k_base"
+) -> int:
+    """
+    Counts the tokens of a list of chat messages including per-message overhead.
+
+    Args:
+        messages (List[dict]): Chat messages with "role" and "content" keys.
+        encoding_name (str, optional): Name of the tiktoken encoding.
+            Defaults to "cl100k_base".
+
+    Returns:
+        int: The (estimated) number of prompt tokens.
+    """
+    return sum(
+        count_tokens(message["content"], encoding_name) + TOKENS_PER_MESSAGE
+        for message in messages
+    )
@@ -0,0 +1,177 @@
+"""Submodule for lightweight per-stage timing traces."""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+_enabled = False
+_events = []  # (name, start in ns, duration in ns, thread id)
+_lock = threading.Lock()
+
+
+def enable_tracing(enabled: bool = True) -> None:
+    """
+    Turns recording of trace spans on or off.
+
+    Args:
+        enabled (bool, optional): Whether spans are recorded. Defaults to True.
+    """
+    global _enabled  # pylint: disable=global-statement
+    _enabled = enabled
+
+
+def is_tracing_enabled() -> bool:
+    """Returns whether trace spans are currently recorded."""
+    return _enabled
+
+
+def reset_tracing() -> None:
+    """Discards all recorded spans."""
+    with _lock:
+        _events.clear()
+
+
+def _record(name: str, start: int, end: int) -> None:
+    with _lock:
+        _events.append((name, start, end - start, threading.get_ident()))
+
+
+class span:  # pylint: disable=invalid-name
+    """
+    Context manager recording the duration of a block as a named span.
+
+    Does nothing but a flag check while tracing is disabled.
+
+    Args:
+        name (str): Name of the stage, e.g. "extract_pages_text".
+    """
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = None
+
+    def __enter__(self) -> "span":
+        if _enabled:
+            self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._start is not None:
+            _record(self.name, self._start, time.perf_counter_ns())
+            self._start = None
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording every call of a function as a span.
+
+    While tracing is disabled, the wrapper calls straight through to the function.
+
+    Args:
+        name (str, optional): Name of the stage. Defaults to the function name.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(span_name, start, time.perf_counter_ns())
+
+        return wrapper
+
+    return decorator
+
+
+def get_stage_summary() -> Dict[str, Dict[str, float]]:
+    """
+    Aggregates the recorded spans per stage.
+
+    Returns:
+        Dict[str, Dict[str, float]]: A dictionary mapping each stage name to its
+        'count' and 'total', 'mean' and 'max' duration in seconds, ordered by
+        descending total duration.
+    """
+    with _lock:
+        events = list(_events)
+
+    summary = {}
+    for name, _, duration, _ in events:
+        stats = summary.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        stats["count"] += 1
+        stats["total"] += duration / 1e9
+        stats["max"] = max(stats["max"], duration / 1e9)
+    for stats in summary.values():
+        stats["mean"] = stats["total"] / stats["count"]
+    return dict(sorted(summary.items(), key=lambda item: -item[1]["total"]))
+
+
+def format_stage_summary() -> str:
+    """
+    Formats the per-stage timing breakdown as a text table.
+
+    Returns:
+        str: The table, one row per stage.
+    """
+    rows = [
+        f"{'stage':<28}{'count':>8}{'total [s]':>12}{'mean [s]':>12}{'max [s]':>12}"
+    ]
+    for name, stats in get_stage_summary().items():
+        rows.append(
+            f"{name:<28}{stats['count']:>8}{stats['total']:>12.3f}"
+            f"{stats['mean']:>12.3f}{stats['max']:>12.3f}"
+        )
+    return "\n".join(rows)
+
+
+def write_chrome_trace(file_path: str = "trace.json") -> None:
+    """
+    Writes the recorded spans in Chrome trace event format.
+
+    The file can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+    Args:
+        file_path (str, optional): Path of the JSON file. Defaults to "trace.json".
+
+    Raises:
+        Exception: If an error occurs during file writing.
+    """
+    with _lock:
+        events = list(_events)
+
+    pid = os.getpid()
+    trace_events = [
+        {
+            "name": name,
+            "ph": "X",
+            "ts": start / 1e3,
+            "dur": duration / 1e3,
+            "pid": pid,
+            "tid": tid,
+        }
+        for name, start, duration, tid in events
+    ]
+    try:
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace_events}, file)
+        logging.info(
+            "Chrome trace with %d spans written to '%s'", len(events), file_path
+        )
+    except Exception as e:
+        logging.error("Error writing Chrome trace '%s': %s", file_path, e)
+        raise
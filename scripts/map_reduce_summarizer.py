@@ -1,18 +1,24 @@
 """Script for generating summaries from PDFs with map-reduce technique."""
 
+import argparse
 import os
 import logging
 from tqdm import tqdm
 
 from genaipy.extractors.pdf import extract_pages_text
-from genaipy.openai_apis.chat import get_chat_response
-from genaipy.prompts.build_prompt import build_prompt
-from genaipy.prompts.generate_summaries import (
-    DEFAULT_SYS_MESSAGE,
-    SUMMARY_PROMPT_TPL,
-    REDUCE_SUMMARY_PROMPT_TPL,
+from genaipy.openai_apis.chat import HedgingPolicy, ModelRoute, ModelRouter
+from genaipy.pipelines.map_reduce import (
+    summarize_documents,
+    summarize_map,
+    summarize_reduce,
+)
+from genaipy.utilities import (
+    enable_tracing,
+    format_stage_summary,
+    write_chrome_trace,
+    write_string_to_txt,
+    validate_api_key,
 )
-from genaipy.utilities import write_string_to_txt, validate_api_key
 
 
 # LOGGER CONFIG
@@ -28,12 +34,36 @@ OPENAI_API_KEY = validate_api_key(env_var_name="OPENAI_API_KEY")
 # PARAMETERS
 BASE_FOLDER = "../data/input"
 OUTPUT_PATH = "../data/output/map_reduce_output.txt"
+OUTPUT_FOLDER = "../data/output/summaries"
 
 MAP_LLM = "gpt-3.5-turbo"
 REDUCE_LLM = "gpt-4-1106-preview"
 MAP_MAX_WORDS = 150
 REDUCE_MAX_WORDS = 350
 
+# Cheap model serves map calls that fit its context, heavy model serves the rest
+ROUTER = ModelRouter(
+    routes=[
+        ModelRoute(
+            MAP_LLM,
+            max_input_tokens=15_000,
+            tasks=frozenset({"map"}),
+            cost_per_1k_tokens=0.001,
+            expected_latency=3.0,
+        ),
+        ModelRoute(
+            REDUCE_LLM,
+            max_input_tokens=120_000,
+            cost_per_1k_tokens=0.01,
+            expected_latency=15.0,
+        ),
+    ],
+    fallbacks={MAP_LLM: REDUCE_LLM},
+)
+
+# Duplicate map calls slower than the p95 latency, hedging at most 10% of calls
+MAP_HEDGING = HedgingPolicy(percentile=95, max_hedge_ratio=0.1)
+
 
 # FUNCTIONS
 def validate_pdf_path(pdf_name):
@@ -70,13 +100,12 @@ def generate_map_summaries(pages):
     map_summaries = []
     for page in tqdm(pages, desc="Generating Map Summaries"):
         try:
-            map_prompt = build_prompt(
-                template=SUMMARY_PROMPT_TPL,
-                text=pages[page]["content"],
+            summary = summarize_map(
+                pages[page]["content"],
                 max_words=MAP_MAX_WORDS,
-            )
-            summary = get_chat_response(
-                map_prompt, sys_message=DEFAULT_SYS_MESSAGE, model=MAP_LLM
+                model=MAP_LLM,
+                router=ROUTER,
+                hedging=MAP_HEDGING,
             )
             map_summaries.append(summary)
             logging.info("Map Summary #%d: %s", page, summary)
@@ -88,16 +117,9 @@ def generate_map_summaries(pages):
 
 def generate_reduce_summary(map_summaries):
     """Generates a final summary from map summaries using reduce summarization."""
-    text = "\n".join(map_summaries).replace("\n\n", "")
     try:
-        reduce_prompt = build_prompt(
-            template=REDUCE_SUMMARY_PROMPT_TPL, text=text, max_words=REDUCE_MAX_WORDS
-        )
-        final_summary = get_chat_response(
-            prompt=reduce_prompt,
-            sys_message=DEFAULT_SYS_MESSAGE,
-            model=REDUCE_LLM,
-            max_tokens=1024,
+        final_summary = summarize_reduce(
+            map_summaries, max_words=REDUCE_MAX_WORDS, model=REDUCE_LLM, router=ROUTER
         )
         logging.info("Final Reduce Summary:\n%s", final_summary)
         return final_summary
@@ -115,8 +137,88 @@ def save_summary(summary, output_path):
         logging.error("Failed to save summary to %s", output_path)
 
 
-def main():
-    """Main function of the map-reduce summarizer."""
+def parse_args():
+    """Parses CLI arguments for non-interactive batch runs."""
+    parser = argparse.ArgumentParser(
+        description="Summarize PDFs with the map-reduce technique. "
+        "Runs interactively for a single PDF if no input folder or manifest is given."
+    )
+    parser.add_argument(
+        "--input_dir", type=str, help="Folder with PDF documents to summarize."
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        help="Text file listing one PDF path per line to summarize.",
+    )
+    parser.add_argument(
+        "--output_dir",
+        type=str,
+        default=OUTPUT_FOLDER,
+        help="Output folder for the per-document summaries.",
+    )
+    parser.add_argument("--start_page", type=int, help="Start page number.")
+    parser.add_argument("--end_page", type=int, help="End page number.")
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=8,
+        help="Number of concurrent workers shared by all documents.",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Log a per-stage timing breakdown at the end of the run.",
+    )
+    parser.add_argument(
+        "--trace_output",
+        type=str,
+        help="Path to write a Chrome trace JSON file to, implies --trace.",
+    )
+    return parser.parse_args()
+
+
+def collect_pdf_paths(input_dir=None, manifest=None):
+    """Collects PDF paths from an input folder and/or a manifest file."""
+    pdf_paths = []
+    if input_dir:
+        pdf_paths.extend(
+            os.path.join(input_dir, name)
+            for name in sorted(os.listdir(input_dir))
+            if name.lower().endswith(".pdf")
+        )
+    if manifest:
+        with open(manifest, "r", encoding="utf-8") as file:
+            pdf_paths.extend(line.strip() for line in file if line.strip())
+
+    pdf_paths = [os.path.normpath(path) for path in pdf_paths]
+    missing = [path for path in pdf_paths if not os.path.isfile(path)]
+    for path in missing:
+        logging.error("PDF file not found at path: %s", path)
+    return [path for path in pdf_paths if path not in missing]
+
+
+def run_batch(args):
+    """Summarizes all PDF documents of the input folder or manifest."""
+    pdf_paths = collect_pdf_paths(args.input_dir, args.manifest)
+    logging.info("Summarizing %d PDF documents.", len(pdf_paths))
+    summarize_documents(
+        pdf_paths,
+        output_dir=args.output_dir,
+        start_page=args.start_page,
+        end_page=args.end_page,
+        map_model=MAP_LLM,
+        reduce_model=REDUCE_LLM,
+        map_max_words=MAP_MAX_WORDS,
+        reduce_max_words=REDUCE_MAX_WORDS,
+        max_workers=args.max_workers,
+        router=ROUTER,
+        hedging=MAP_HEDGING,
+    )
+
+
+def run_interactive():
+    """Summarizes a single PDF document with page range entered by the user."""
     pdf_name = input("Enter the name of the PDF file: ")
     start_page = input("Enter the start page number: ")
     end_page = input("Enter the end page number: ")
@@ -133,6 +235,25 @@ def main():
         logging.error("An error occurred in the main function: %s", e)
 
 
+def main():
+    """Main function of the map-reduce summarizer."""
+    args = parse_args()
+    tracing = args.trace or bool(args.trace_output)
+    enable_tracing(tracing)
+    if args.input_dir or args.manifest:
+        try:
+            run_batch(args)
+        except Exception as e:
+            logging.error("An error occurred in the batch run: %s", e)
+    else:
+        run_interactive()
+
+    if tracing:
+        logging.info("Stage timings:\n%s", format_stage_summary())
+    if args.trace_output:
+        write_chrome_trace(args.trace_output)
+
+
 # MAIN
 if __name__ == "__main__":
     main()
@@ -1,9 +1,9 @@
 """Script for Automated Generation of Synthetic Q&A Datasets."""
 
 import argparse
+import json
 import os
 import logging
-import pandas as pd
 from tqdm import tqdm
 
 from genaipy.extractors.pdf import extract_pages_text
@@ -11,9 +11,13 @@ from genaipy.openai_apis.chat import get_chat_response
 from genaipy.prompts.build_prompt import build_prompt
 from genaipy.prompts.generate_qa import GENERATE_QA_TPL
 from genaipy.utilities import (
-    convert_json_to_df,
-    convert_df_to_messages,
-    write_data_to_jsonl,
+    DatasetBuilder,
+    NearDuplicateIndex,
+    deduplicate_pages,
+    enable_tracing,
+    format_stage_summary,
+    span,
+    write_chrome_trace,
     validate_api_key,
 )
 
@@ -33,10 +37,32 @@ parser.add_argument(
 parser.add_argument("--start_page", type=int, required=True, help="Start page number.")
 parser.add_argument("--end_page", type=int, required=True, help="End page number.")
 parser.add_argument(
-    "--output_path",
+    "--output_dir",
     type=str,
-    default="../data/output/synthetic_dataset.jsonl",
-    help="Output path for the dataset.",
+    default="../data/output/synthetic_dataset",
+    help="Output folder for the dataset shards and manifest.",
+)
+parser.add_argument(
+    "--shard_mb",
+    type=float,
+    default=100,
+    help="Maximum size of a dataset shard in MB.",
+)
+parser.add_argument(
+    "--validation_ratio",
+    type=float,
+    default=0.1,
+    help="Fraction of Q&A pairs assigned to the validation split.",
+)
+parser.add_argument(
+    "--trace",
+    action="store_true",
+    help="Log a per-stage timing breakdown at the end of the run.",
+)
+parser.add_argument(
+    "--trace_output",
+    type=str,
+    help="Path to write a Chrome trace JSON file to, implies --trace.",
 )
 args = parser.parse_args()
 
@@ -45,6 +71,7 @@ BASE_FOLDER = "../data/input"
 SYS_MESSAGE_GEN = "You are a legal expert in AI law. You outline complex regulations and legal requirements with great detail and accuracy in simple English."
 SYS_MESSAGE_DATA = "You are a legal expert in AI law and your job is to answer questions about the 'EU AI Act' by the European Union."
 NUM_PAIRS = 3
+DEDUP_THRESHOLD = 0.9  # Estimated Jaccard similarity above which texts are duplicates
 
 
 # Functions
@@ -70,15 +97,15 @@ def extract_text(pdf_name, start_page, end_page):
             pdf_path=full_path, start_page=start_page, end_page=end_page
         )
         logging.info("Text loaded from %d pages.", len(pages))
-        return pages
+        with span("deduplicate_pages"):
+            return deduplicate_pages(pages, threshold=DEDUP_THRESHOLD)
     except Exception as e:
         logging.error("Error in text extraction: %s", e)
         raise
 
 
 def generate_qa_pairs(pages):
-    """Generates Q&A pairs from text."""
-    qa_dataset = []
+    """Generates Q&A pairs from text, yielding the question and answer of each pair."""
     for page in tqdm(pages, desc="Generating Q&A pairs"):
         try:
             qa_prompt = build_prompt(
@@ -90,27 +117,28 @@ def generate_qa_pairs(pages):
                 model="gpt-4-1106-preview",
                 response_format={"type": "json_object"},
             )
-            qa_df = convert_json_to_df(qa_response)
-            qa_dataset.append(qa_df)
+            qa_pairs = list(json.loads(qa_response).values())
             logging.info("Q&A pairs created for page #%d", page)
         except Exception as e:
             logging.error("Error in Q&A generation: %s", e)
             raise
-    return qa_dataset
+        for qa_pair in qa_pairs:
+            yield qa_pair["question"], qa_pair["answer"]
 
 
-def compile_dataset(qa_dataset, output_path):
-    """Compiles and saves the Q&A dataset."""
+def compile_dataset(qa_pairs, output_dir, shard_mb=100, validation_ratio=0.1):
+    """Deduplicates a stream of Q&A pairs and writes them into dataset shards."""
     try:
-        final_df = pd.concat(qa_dataset, ignore_index=True)
-        messages = convert_df_to_messages(
-            df=final_df,
-            system_msg=SYS_MESSAGE_DATA,
-            user_col="question",
-            assistant_col="answer",
-        )
-        write_data_to_jsonl(data=messages, file_path=output_path)
-        logging.info("Dataset saved to %s", output_path)
+        index = NearDuplicateIndex(threshold=DEDUP_THRESHOLD)
+        with span("compile_dataset"), DatasetBuilder(
+            output_dir,
+            max_shard_bytes=int(shard_mb * 2**20),
+            validation_ratio=validation_ratio,
+        ) as builder:
+            for question, answer in qa_pairs:
+                if index.add(len(index), f"{question}\n{answer}") is None:
+                    builder.add_pair(question, answer, SYS_MESSAGE_DATA)
+        logging.info("Dataset saved to %s", output_dir)
     except Exception as e:
         logging.error("Error in dataset compilation: %s", e)
         raise
@@ -118,13 +146,21 @@ def compile_dataset(qa_dataset, output_path):
 
 def main():
     """Main function of synthetic data generator"""
+    tracing = args.trace or bool(args.trace_output)
+    enable_tracing(tracing)
     try:
         pages = extract_text(args.pdf_name, args.start_page, args.end_page)
-        qa_dataset = generate_qa_pairs(pages)
-        compile_dataset(qa_dataset, args.output_path)
+        # Pairs are generated lazily, so each page is written as soon as it is answered
+        qa_pairs = generate_qa_pairs(pages)
+        compile_dataset(qa_pairs, args.output_dir, args.shard_mb, args.validation_ratio)
     except Exception as e:
         logging.error("Error in main function: %s", e)
 
+    if tracing:
+        logging.info("Stage timings:\n%s", format_stage_summary())
+    if args.trace_output:
+        write_chrome_trace(args.trace_output)
+
 
 if __name__ == "__main__":
     main()
@@ -10,10 +10,16 @@ setup(
     packages=find_packages(),
     install_requires=[
         "beautifulsoup4==4.12.2",
+        "httpx>=0.23.0,<1",
         "openai==1.3.6",
         "pypdf2==2.10.5",
         "requests==2.31.0",
         # Other dependencies
     ],
-    python_requires=">=3.6",
+    extras_require={
+        "pdf-fast": ["pypdfium2"],  # Faster PDF text extraction engine
+        "http2": ["h2"],  # HTTP/2 for the shared OpenAI client
+        "semantic-cache": ["numpy", "hnswlib"],  # Semantic cache with ANN search
+    },
+    python_requires=">=3.7",
 )
@@ -0,0 +1,108 @@
+"""Module with unit tests for the shared OpenAI client of the chat module."""
+
+import threading
+from types import SimpleNamespace
+import httpx
+import openai
+import pytest
+from genaipy.openai_apis import chat
+from genaipy.openai_apis.chat import (
+    configure_client,
+    get_client,
+    request_chat_completion,
+    set_client,
+)
+from genaipy.openai_apis.embeddings import get_embeddings
+
+
+@pytest.fixture(autouse=True)
+def reset_client(monkeypatch):
+    """Starts every test without a shared client and a dummy API key"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(chat, "_client", None)
+
+
+# Unit tests
+def test_get_client_is_shared_across_threads():
+    """Test that concurrent callers create and share a single client"""
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(get_client())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(client) for client in clients}) == 1
+    assert get_client() is clients[0]
+
+
+def test_configure_client_settings(monkeypatch):
+    """Test that pool limits and timeouts are applied to the shared client"""
+    client = configure_client(
+        max_connections=7, timeout=12.0, connect_timeout=2.0, http2=False, max_retries=0
+    )
+    assert get_client() is client
+    pool = client._client._transport._pool  # pylint: disable=protected-access
+    assert pool._max_connections == 7  # pylint: disable=protected-access
+
+    timeouts = []
+
+    def fake_send(self, request, **kwargs):  # pylint: disable=unused-argument
+        timeouts.append(request.extensions["timeout"])
+        raise httpx.ConnectError("offline", request=request)
+
+    monkeypatch.setattr(httpx.Client, "send", fake_send)
+    with pytest.raises(openai.APIConnectionError):
+        client.chat.completions.create(model="gpt-4", messages=[])
+    assert timeouts[0]["connect"] == 2.0
+    assert timeouts[0]["read"] == 12.0
+
+
+def test_replaced_client_is_closed():
+    """Test that configuring or setting a new client closes the previous one"""
+    first = configure_client(http2=False)
+    second = configure_client(http2=False)
+    assert first.is_closed() and not second.is_closed()
+    set_client(None)
+    assert second.is_closed()
+
+
+def test_helpers_use_injected_client():
+    """Test that chat and embedding requests go through an injected client"""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        if "input" in kwargs:
+            return SimpleNamespace(
+                data=[SimpleNamespace(index=0, embedding=[1.0, 0.0])]
+            )
+        return "completion"
+
+    endpoint = SimpleNamespace(create=create)
+    set_client(
+        SimpleNamespace(chat=SimpleNamespace(completions=endpoint), embeddings=endpoint)
+    )
+
+    assert request_chat_completion([], model="gpt-4", timeout=3) == "completion"
+    assert get_embeddings(["text"]) == [[1.0, 0.0]]
+    assert calls[0] == {"model": "gpt-4", "messages": [], "timeout": 3}
+    assert calls[1]["input"] == ["text"]
+
+
+def test_default_client_uses_module_settings(monkeypatch):
+    """Test that module-level openai settings apply unless overridden explicitly"""
+    monkeypatch.delenv("OPENAI_API_KEY")
+    monkeypatch.setattr(openai, "api_key", "sk-module")
+    monkeypatch.setattr(openai, "organization", "org-module")
+    monkeypatch.setattr(openai, "base_url", "https://proxy.example/v1")
+
+    client = get_client()
+    assert client.api_key == "sk-module"
+    assert client.organization == "org-module"
+    assert str(client.base_url) == "https://proxy.example/v1/"
+
+    client = configure_client(api_key="sk-explicit", http2=False)
+    assert client.api_key == "sk-explicit"
+    assert client.organization == "org-module"
@@ -0,0 +1,82 @@
+"""Module with unit tests for multi-turn conversations."""
+
+from types import SimpleNamespace
+import pytest
+from genaipy.openai_apis import conversation
+from genaipy.openai_apis.chat import ChatAPIRequestException
+from genaipy.openai_apis.conversation import Conversation
+
+
+def fake_completion(content: str):
+    """Builds an object shaped like an OpenAI chat completion"""
+    return SimpleNamespace(
+        usage=SimpleNamespace(total_tokens=1),
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+    )
+
+
+@pytest.fixture
+def sent_messages(monkeypatch):
+    """Records the messages of every request and answers with a fixed reply"""
+    requests = []
+
+    def fake_request(messages, model, **kwargs):  # pylint: disable=unused-argument
+        requests.append(messages)
+        return fake_completion("reply " * 10)
+
+    monkeypatch.setattr(conversation, "request_chat_completion", fake_request)
+    return requests
+
+
+# Unit tests
+def test_history_and_token_count(sent_messages):
+    """Test that turns are recorded and token counts are tracked incrementally"""
+    chat = Conversation(sys_message="You are helpful.")
+    tokens_before = chat.num_tokens
+    assert chat.send("Hello there") == "reply " * 10
+    assert len(chat) == 2
+    assert chat.num_tokens > tokens_before
+    assert [m["role"] for m in sent_messages[0]] == ["system", "user"]
+
+
+def test_truncate_keeps_budget(sent_messages):
+    """Test that the oldest turns are dropped to stay within the budget"""
+    chat = Conversation(max_prompt_tokens=60, keep_last_messages=2)
+    for idx in range(10):
+        chat.send(f"Question {idx}: " + "word " * 20)
+    last_request = sent_messages[-1]
+    assert last_request[-1]["content"].startswith("Question 9")
+    assert len(last_request) < 19
+    assert chat.summary == ""
+
+
+def test_summarize_older_turns(sent_messages, monkeypatch):
+    """Test that older turns are condensed into a running summary"""
+    monkeypatch.setattr(
+        conversation, "get_chat_response", lambda prompt, model: "Short summary."
+    )
+    chat = Conversation(max_prompt_tokens=60, strategy="summarize")
+    for idx in range(5):
+        chat.send(f"Question {idx}: " + "word " * 20)
+    assert chat.summary == "Short summary."
+    assert "Short summary." in sent_messages[-1][0]["content"]
+
+
+def test_failed_request_is_not_recorded(monkeypatch):
+    """Test that a failed request leaves no dangling user message in the history"""
+
+    def failing_request(messages, model, **kwargs):
+        raise ChatAPIRequestException("failed")
+
+    monkeypatch.setattr(conversation, "request_chat_completion", failing_request)
+    chat = Conversation()
+    with pytest.raises(ChatAPIRequestException):
+        chat.send("Hello")
+    assert len(chat) == 0
+    assert chat.num_tokens == 0
+
+
+def test_invalid_strategy():
+    """Test that an unknown strategy raises a ValueError"""
+    with pytest.raises(ValueError):
+        Conversation(strategy="forget")
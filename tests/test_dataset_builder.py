@@ -0,0 +1,91 @@
+"""Module with unit tests for the sharded fine-tuning dataset builder."""
+
+import json
+import pytest
+
+from genaipy.utilities.dataset_builder import DatasetBuilder, iter_dataset_records
+
+SYS_MESSAGE = "You are a legal expert in AI law."
+
+
+def _build(output_dir, num_records=200, **kwargs):
+    """Builds a dataset of numbered question-answer pairs and returns the manifest"""
+    with DatasetBuilder(str(output_dir), encoding_name=None, **kwargs) as builder:
+        for idx in range(num_records):
+            builder.add_pair(
+                f"What does article {idx} say?", f"Answer {idx}.", SYS_MESSAGE
+            )
+    return builder.close()
+
+
+# Unit tests
+def test_shards_are_size_bounded(tmp_path):
+    """Test that records are split into shards below the size limit"""
+    manifest = _build(tmp_path, max_shard_bytes=2000, max_workers=2)
+    assert len(manifest["shards"]) > 2
+    for shard in manifest["shards"]:
+        file_path = tmp_path / shard["file"]
+        assert file_path.stat().st_size == shard["num_bytes"] <= 2000
+        assert shard["min_tokens"] <= shard["mean_tokens"] <= shard["max_tokens"]
+
+    records = list(iter_dataset_records(str(tmp_path)))
+    assert len(records) == 200
+    assert records[0][1]["messages"][0] == {"role": "system", "content": SYS_MESSAGE}
+
+
+def test_manifest_and_split(tmp_path):
+    """Test that the manifest sums up the shards and the split is reproducible"""
+    manifest = _build(tmp_path / "first", validation_ratio=0.25)
+    splits = manifest["splits"]
+    assert splits["train"]["num_records"] + splits["validation"]["num_records"] == 200
+    assert 20 < splits["validation"]["num_records"] < 80
+    assert splits["train"]["num_tokens"] == sum(
+        shard["num_tokens"] for shard in manifest["shards"] if shard["split"] == "train"
+    )
+    with open(tmp_path / "first" / "manifest.json", encoding="utf-8") as file:
+        assert json.load(file) == manifest
+
+    second = _build(tmp_path / "second", validation_ratio=0.25, max_shard_bytes=1000)
+    first_validation = list(iter_dataset_records(str(tmp_path / "first"), "validation"))
+    second_validation = list(
+        iter_dataset_records(str(tmp_path / "second"), "validation")
+    )
+    assert first_validation == second_validation
+    assert len(second["shards"]) > len(manifest["shards"])
+
+
+def test_invalid_records(tmp_path):
+    """Test that invalid records and records after closing are rejected"""
+    builder = DatasetBuilder(str(tmp_path), encoding_name=None)
+    with pytest.raises(ValueError):
+        builder.add({"question": "Q?", "answer": "A."})
+    builder.close()
+    with pytest.raises(ValueError):
+        builder.add_pair("Q?", "A.")
+
+
+def test_no_manifest_after_error(tmp_path):
+    """Test that a build failing inside the with block leaves no manifest behind"""
+    _build(tmp_path)
+    assert (tmp_path / "manifest.json").exists()
+
+    with pytest.raises(RuntimeError):
+        with DatasetBuilder(str(tmp_path), encoding_name=None) as builder:
+            builder.add_pair("Q?", "A.")
+            raise RuntimeError("generation failed")
+    assert not (tmp_path / "manifest.json").exists()
+    with pytest.raises(ValueError):
+        builder.close()
+
+
+def test_rebuild_removes_stale_shards(tmp_path):
+    """Test that rebuilding a folder leaves only the shards of the new build"""
+    (tmp_path / "notes.jsonl").write_text("{}\n", encoding="utf-8")
+    first = _build(tmp_path, num_records=20, max_shard_bytes=300)
+    assert len(first["shards"]) > 3
+
+    second = _build(tmp_path, num_records=3, max_shard_bytes=300)
+    shard_files = sorted(path.name for path in tmp_path.glob("dataset-*.jsonl"))
+    assert shard_files == sorted(shard["file"] for shard in second["shards"])
+    assert (tmp_path / "notes.jsonl").exists()
+    assert len(list(iter_dataset_records(str(tmp_path)))) == 3
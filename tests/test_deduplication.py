@@ -0,0 +1,80 @@
+"""Module with unit tests for near-duplicate detection utilities."""
+
+import pytest
+from genaipy.utilities.deduplication import (
+    NearDuplicateIndex,
+    deduplicate_pages,
+    deduplicate_records,
+)
+
+ARTICLE = (
+    "Providers of high-risk AI systems shall establish, implement, document and "
+    "maintain a risk management system. The risk management system shall consist of "
+    "a continuous iterative process run throughout the entire lifecycle of the system, "
+    "requiring regular systematic updating and review by the provider."
+)
+OTHER_ARTICLE = (
+    "Member States shall designate national competent authorities responsible for "
+    "market surveillance. Authorities shall have adequate financial and human "
+    "resources and cooperate with the Commission on enforcement of this regulation."
+)
+
+
+# Unit tests
+def test_identical_text_is_duplicate():
+    """Test that an identical text is found as duplicate of the indexed text"""
+    index = NearDuplicateIndex(threshold=0.8)
+    assert index.add("a", ARTICLE) is None
+    assert index.add("b", ARTICLE) == "a"
+    assert len(index) == 1
+
+
+def test_whitespace_and_case_variants_are_duplicates():
+    """Test that whitespace, case and punctuation differences are ignored"""
+    index = NearDuplicateIndex(threshold=0.9)
+    index.add("a", ARTICLE)
+    variant = "  " + ARTICLE.upper().replace(" ", "\n  ").replace(",", ";")
+    assert index.query(variant) == "a"
+
+
+def test_different_text_is_not_duplicate():
+    """Test that an unrelated text is not found as duplicate"""
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add("a", ARTICLE)
+    assert index.add("b", OTHER_ARTICLE) is None
+    assert len(index) == 2
+
+
+def test_invalid_threshold():
+    """Test that a threshold outside (0, 1] raises a ValueError"""
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(threshold=0)
+
+
+def test_deduplicate_pages():
+    """Test that repeated pages are dropped and keys are renumbered"""
+    pages = {
+        1: {"page_number": 10, "content": ARTICLE},
+        2: {"page_number": 11, "content": OTHER_ARTICLE},
+        3: {"page_number": 12, "content": ARTICLE + " "},
+    }
+    result = deduplicate_pages(pages)
+    assert list(result) == [1, 2]
+    assert [page["page_number"] for page in result.values()] == [10, 11]
+
+
+def test_deduplicate_records():
+    """Test that duplicate question-answer records are dropped in original order"""
+    records = [
+        {"question": "What must providers establish?", "answer": ARTICLE},
+        {"question": "Who designates authorities?", "answer": OTHER_ARTICLE},
+        {"question": "What must providers establish?", "answer": ARTICLE},
+    ]
+    result = deduplicate_records(records, keys=("question", "answer"))
+    assert result == records[:2]
+
+
+def test_deduplicate_records_missing_key():
+    """Test that a missing key raises a KeyError"""
+    with pytest.raises(KeyError):
+        deduplicate_records([{"question": "Q?"}], keys=("question", "answer"))
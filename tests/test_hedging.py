@@ -0,0 +1,147 @@
+"""Module with unit tests for hedged Chat API requests."""
+
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from genaipy.openai_apis import chat
+from genaipy.openai_apis.chat import (
+    ChatAPIRequestException,
+    HedgingPolicy,
+    request_hedged_chat_completion,
+)
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+@pytest.fixture
+def policy():
+    """Policy that hedges after the median of ten 10 ms warm-up latencies"""
+    policy = HedgingPolicy(percentile=50, min_samples=10, max_hedge_ratio=1.0)
+    for _ in range(10):
+        policy.record_latency(0.01)
+    yield policy
+    policy.shutdown()
+
+
+# Unit tests
+def test_no_hedge_without_samples(monkeypatch):
+    """Test that requests are not hedged before enough latencies are recorded"""
+    calls = []
+    monkeypatch.setattr(
+        chat,
+        "request_chat_completion",
+        lambda messages, model, **kwargs: calls.append(model) or "done",
+    )
+    policy = HedgingPolicy(min_samples=5)
+    assert policy.hedge_delay() is None
+    assert request_hedged_chat_completion(MESSAGES, policy) == "done"
+    assert calls == ["gpt-3.5-turbo"]
+    policy.shutdown()
+
+
+def test_hedge_delay_percentile():
+    """Test that the hedge delay is the configured percentile of recent latencies"""
+    policy = HedgingPolicy(percentile=90, min_samples=10)
+    for latency in range(1, 11):
+        policy.record_latency(latency)
+    assert policy.hedge_delay() == 9
+
+
+def test_slow_request_is_hedged(policy, monkeypatch):
+    """Test that a straggling request is hedged and the faster response wins"""
+    release = threading.Event()
+    policy.fallback_model = "fallback"
+
+    def fake_request(messages, model, **kwargs):  # pylint: disable=unused-argument
+        if model == "slow":
+            release.wait(timeout=5)
+            return "slow response"
+        return "fallback response"
+
+    monkeypatch.setattr(chat, "request_chat_completion", fake_request)
+    start = time.monotonic()
+    result = request_hedged_chat_completion(MESSAGES, policy, model="slow")
+    release.set()
+    assert result == "fallback response"
+    assert time.monotonic() - start < 1
+    assert policy.num_hedges == 1
+
+
+def test_hedge_budget(policy, monkeypatch):
+    """Test that no hedge is sent once the hedge budget is used up"""
+    policy.max_hedge_ratio = 0.0
+    calls = []
+
+    def fake_request(messages, model, **kwargs):  # pylint: disable=unused-argument
+        calls.append(model)
+        time.sleep(0.05)
+        return "done"
+
+    monkeypatch.setattr(chat, "request_chat_completion", fake_request)
+    assert request_hedged_chat_completion(MESSAGES, policy) == "done"
+    assert len(calls) == 1
+    assert policy.num_hedges == 0
+
+
+def test_all_requests_fail(policy, monkeypatch):
+    """Test that the last error is raised if the original and hedged request fail"""
+
+    def fake_request(messages, model, **kwargs):  # pylint: disable=unused-argument
+        time.sleep(0.05)
+        raise ChatAPIRequestException("failed")
+
+    monkeypatch.setattr(chat, "request_chat_completion", fake_request)
+    with pytest.raises(ChatAPIRequestException):
+        request_hedged_chat_completion(MESSAGES, policy)
+    assert policy.num_hedges == 1
+
+
+def test_latency_excludes_retries(monkeypatch):
+    """Test that only the successful attempt is recorded, not failures and retry delays"""
+    real_sleep = time.sleep
+    attempts = []
+
+    def create(**kwargs):  # pylint: disable=unused-argument
+        attempts.append(kwargs["model"])
+        if len(attempts) == 1:
+            raise ConnectionError("reset")
+        return "done"
+
+    fake_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    monkeypatch.setattr(chat, "_client", fake_client)
+    monkeypatch.setattr(chat.time, "sleep", lambda seconds: real_sleep(0.2))
+    policy = HedgingPolicy(percentile=50, min_samples=1)
+    assert request_hedged_chat_completion(MESSAGES, policy) == "done"
+    assert len(attempts) == 2
+    assert policy.hedge_delay() < 0.1
+    policy.shutdown()
+
+
+def test_pool_grows_with_concurrency(monkeypatch):
+    """Test that many concurrent callers do not queue behind a fixed pool"""
+    monkeypatch.setattr(
+        chat,
+        "request_chat_completion",
+        lambda messages, model, **kwargs: time.sleep(0.1) or "done",
+    )
+    policy = HedgingPolicy(max_hedge_ratio=0.0)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                request_hedged_chat_completion(MESSAGES, policy)
+            )
+        )
+        for _ in range(64)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["done"] * 64
+    assert time.monotonic() - start < 0.3
+    policy.shutdown()
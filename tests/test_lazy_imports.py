@@ -0,0 +1,60 @@
+"""Module with unit tests for lazy loading of heavy dependencies."""
+
+import os
+import subprocess
+import sys
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["pandas", "PyPDF2", "bs4", "requests"]
+
+
+def _loaded_heavy_modules(statement: str) -> list:
+    """Runs a statement in a fresh interpreter and returns heavy modules it loaded"""
+    code = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+# Unit tests
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import genaipy.utilities",
+        "from genaipy.utilities import write_string_to_txt, validate_api_key",
+        "import genaipy.extractors.pdf",
+        "import genaipy.extractors.web",
+        "from genaipy.prompts.build_prompt import build_prompt",
+    ],
+)
+def test_no_heavy_imports(statement):
+    """Test that lightweight imports do not load heavy dependencies"""
+    assert _loaded_heavy_modules(statement) == []
+
+
+def test_lazy_attribute_access():
+    """Test that helpers are resolved from their submodules on access"""
+    import genaipy.utilities  # pylint: disable=import-outside-toplevel
+    from genaipy.utilities.file_operations import (  # pylint: disable=import-outside-toplevel
+        write_string_to_txt,
+    )
+
+    assert genaipy.utilities.write_string_to_txt is write_string_to_txt
+    assert set(genaipy.utilities.__all__) <= set(dir(genaipy.utilities))
+
+
+def test_unknown_attribute():
+    """Test that unknown attributes raise an AttributeError"""
+    import genaipy.utilities  # pylint: disable=import-outside-toplevel
+
+    with pytest.raises(AttributeError):
+        genaipy.utilities.does_not_exist  # pylint: disable=pointless-statement
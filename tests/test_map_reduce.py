@@ -0,0 +1,53 @@
+"""Module with unit tests for batch map-reduce summarization."""
+
+import threading
+import pytest
+from genaipy.pipelines import map_reduce
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """Records the order of extractions and map calls with instant fake results"""
+    events = []
+    lock = threading.Lock()
+
+    def fake_extract_pages_text(pdf_path, start_page=None, end_page=None):
+        with lock:
+            events.append(("extract", pdf_path))
+        return {1: {"page_number": 1, "content": f"Text of {pdf_path}"}}
+
+    def fake_get_chat_response(prompt, task=None, **kwargs):
+        with lock:
+            events.append((task, prompt))
+        return f"Summary for {task}"
+
+    monkeypatch.setattr(map_reduce, "extract_pages_text", fake_extract_pages_text)
+    monkeypatch.setattr(map_reduce, "get_chat_response", fake_get_chat_response)
+    return events
+
+
+# Unit tests
+def test_documents_in_flight_are_bounded(fake_backend):
+    """Test that map calls start before most documents are extracted"""
+    pdf_paths = [f"doc_{idx}.pdf" for idx in range(100)]
+    summaries = map_reduce.summarize_documents(
+        pdf_paths, max_workers=4, max_documents=4
+    )
+    assert set(summaries) == set(pdf_paths)
+
+    stages = [stage for stage, _ in fake_backend]
+    first_map = stages.index("map")
+    assert stages[:first_map].count("extract") <= 4
+    assert stages.count("reduce") == 100
+
+
+def test_output_names_depend_on_input_path(fake_backend, tmp_path):
+    """Test that documents sharing a file name get distinct, deterministic outputs"""
+    pdf_paths = ["a/report.pdf", "b/report.pdf", "c/other.pdf"]
+    expected = map_reduce._output_paths(str(tmp_path), pdf_paths)
+    assert expected == map_reduce._output_paths(str(tmp_path), pdf_paths[::-1])
+    assert expected["c/other.pdf"] == str(tmp_path / "other_summary.txt")
+    assert len(set(expected.values())) == 3
+
+    map_reduce.summarize_documents(pdf_paths, output_dir=str(tmp_path))
+    assert sorted(str(path) for path in tmp_path.iterdir()) == sorted(expected.values())
@@ -0,0 +1,148 @@
+"""Module with unit tests for the chat model router."""
+
+import pytest
+from genaipy.openai_apis import chat
+from genaipy.openai_apis.chat import (
+    ChatAPIRequestException,
+    ModelRoute,
+    ModelRouter,
+    request_routed_chat_completion,
+)
+
+SMALL = [{"role": "user", "content": "Summarize this page."}]
+LARGE = [{"role": "user", "content": "word " * 20_000}]
+
+
+@pytest.fixture
+def router():
+    """Router with a cheap model for short map requests and a heavy model for the rest"""
+    return ModelRouter(
+        routes=[
+            ModelRoute("heavy", max_input_tokens=100_000, cost_per_1k_tokens=0.01),
+            ModelRoute(
+                "cheap",
+                max_input_tokens=1_000,
+                tasks=frozenset({"map"}),
+                cost_per_1k_tokens=0.001,
+            ),
+        ],
+        fallbacks={"cheap": "heavy"},
+        failure_threshold=2,
+    )
+
+
+# Unit tests
+def test_cheapest_eligible_model(router):
+    """Test that short map requests go to the cheap model"""
+    assert router.select_model(SMALL, task="map") == "cheap"
+
+
+def test_task_restriction(router):
+    """Test that tasks not served by the cheap model go to the heavy model"""
+    assert router.select_model(SMALL, task="reduce") == "heavy"
+
+
+def test_large_input(router):
+    """Test that inputs exceeding the cheap model's limit go to the heavy model"""
+    assert router.select_model(LARGE, task="map") == "heavy"
+
+
+def test_no_eligible_route():
+    """Test that a ValueError is raised if no route fits the input size"""
+    router = ModelRouter(routes=[ModelRoute("tiny", max_input_tokens=10)])
+    with pytest.raises(ValueError):
+        router.select_model(LARGE)
+
+
+def test_latency_budget():
+    """Test that the latency budget excludes slow models even if they are cheaper"""
+    router = ModelRouter(
+        routes=[
+            ModelRoute("fast", max_input_tokens=100_000, cost_per_1k_tokens=1.0),
+            ModelRoute(
+                "slow",
+                max_input_tokens=100_000,
+                cost_per_1k_tokens=0.1,
+                expected_latency=9,
+            ),
+        ],
+        max_latency=5,
+    )
+    assert router.select_model(SMALL) == "fast"
+
+
+def test_cost_budget_exceeded():
+    """Test that the cheapest model is used if no model is within the cost budget"""
+    router = ModelRouter(
+        routes=[
+            ModelRoute("large", max_input_tokens=100_000, cost_per_1k_tokens=2.0),
+            ModelRoute("small", max_input_tokens=50_000, cost_per_1k_tokens=1.0),
+        ],
+        max_cost_per_request=0.0001,
+    )
+    assert router.select_model(SMALL) == "small"
+    router.record_failure("small")
+    router.record_failure("small")
+    assert router.select_model(SMALL) == "large"
+
+
+def test_repeated_failures_skip_model(router):
+    """Test that a model is skipped after repeated failures"""
+    router.record_failure("cheap")
+    assert router.select_model(SMALL, task="map") == "cheap"
+    router.record_failure("cheap")
+    assert router.select_model(SMALL, task="map") == "heavy"
+
+
+def test_fallback_on_failure(router, monkeypatch):
+    """Test that a failing request is repeated with the fallback model"""
+    models = []
+
+    def fake_request(messages, model, **kwargs):  # pylint: disable=unused-argument
+        models.append(model)
+        if model == "cheap":
+            raise ChatAPIRequestException("throttled")
+        return "completion"
+
+    monkeypatch.setattr(chat, "request_chat_completion", fake_request)
+    assert request_routed_chat_completion(SMALL, router, task="map") == "completion"
+    assert models == ["cheap", "heavy"]
+
+
+def test_failing_fallback_is_skipped(router, monkeypatch):
+    """Test that fallback failures count towards skipping the fallback model"""
+    models = []
+
+    def fake_request(messages, model, **kwargs):  # pylint: disable=unused-argument
+        models.append(model)
+        raise ChatAPIRequestException("unavailable")
+
+    monkeypatch.setattr(chat, "request_chat_completion", fake_request)
+    for _ in range(2):
+        with pytest.raises(ChatAPIRequestException):
+            request_routed_chat_completion(SMALL, router, task="map")
+    assert models == ["cheap", "heavy", "cheap", "heavy"]
+
+    models.clear()
+    with pytest.raises(ChatAPIRequestException):
+        request_routed_chat_completion(SMALL, router, task="map")
+    assert models == ["cheap"]  # the fallback is in cooldown
+
+
+def test_fallback_must_be_eligible(router, monkeypatch):
+    """Test that a fallback without a route for the request is not used"""
+    models = []
+
+    def fake_request(messages, model, **kwargs):  # pylint: disable=unused-argument
+        models.append(model)
+        if model == "heavy":
+            raise ChatAPIRequestException("throttled")
+        return "completion"
+
+    monkeypatch.setattr(chat, "request_chat_completion", fake_request)
+    router.fallbacks["heavy"] = "cheap"
+    with pytest.raises(ChatAPIRequestException):
+        request_routed_chat_completion(LARGE, router, task="map")
+    with pytest.raises(ChatAPIRequestException):
+        request_routed_chat_completion(SMALL, router, task="reduce")
+    assert models == ["heavy", "heavy"]
@@ -0,0 +1,39 @@
+"""Module with unit tests for the on-disk page store."""
+
+import os
+import pytest
+from genaipy.extractors.page_store import PageStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Page store with three pages in a temporary folder"""
+    with PageStore(directory=str(tmp_path)) as page_store:
+        for key, page_number in enumerate([4, 5, 6], start=1):
+            page_store.add(key, page_number, f"Content of page {page_number}")
+        page_store.commit()
+        yield page_store
+
+
+# Unit tests
+def test_dict_compatible_access(store):
+    """Test that the store can be used like the dictionary of extracted pages"""
+    assert len(store) == 3
+    assert list(store) == [1, 2, 3]
+    assert store[2] == {"page_number": 5, "content": "Content of page 5"}
+    assert dict(store)[3]["content"] == "Content of page 6"
+    assert 1 in store and 4 not in store
+
+
+def test_missing_key(store):
+    """Test that a missing key raises a KeyError"""
+    with pytest.raises(KeyError):
+        store[10]  # pylint: disable=pointless-statement
+
+
+def test_close_removes_file(tmp_path):
+    """Test that closing the store deletes its temporary file"""
+    page_store = PageStore(directory=str(tmp_path))
+    assert os.path.exists(page_store.path)
+    page_store.close()
+    assert not os.path.exists(page_store.path)
@@ -0,0 +1,68 @@
+"""Module with unit tests for PDF text extraction."""
+
+import pytest
+from genaipy.extractors.pdf import available_engines, extract_pages_text
+
+pymupdf = pytest.importorskip("pymupdf")
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """PDF document with two pages of multi-line text"""
+    file_path = str(tmp_path / "document.pdf")
+    document = pymupdf.open()
+    for page_number in (1, 2):
+        page = document.new_page()
+        page.insert_text((72, 72), f"Page {page_number}\nSecond line")
+    document.save(file_path)
+    document.close()
+    return file_path
+
+
+def _leftover_page_stores(directory):
+    """Lists temporary page store files left in a folder"""
+    return [path for path in directory.iterdir() if path.name.startswith("genaipy_")]
+
+
+# Unit tests
+@pytest.mark.parametrize("engine", available_engines())
+def test_engines_use_newline_line_breaks(pdf_path, engine):
+    """Test that every engine separates lines with a plain newline"""
+    pages = extract_pages_text(pdf_path, engine=engine)
+    assert len(pages) == 2
+    for page in pages.values():
+        assert "\r" not in page["content"]
+        assert "Second line" in page["content"].split("\n")
+
+
+@pytest.mark.parametrize("engine", available_engines())
+def test_corrupt_file_closes_page_store(tmp_path, caplog, engine):
+    """Test that an engine error for a non-PDF file is logged and the page store removed"""
+    file_path = tmp_path / "corrupt.pdf"
+    file_path.write_text("not a pdf", encoding="utf-8")
+    with pytest.raises(Exception):
+        extract_pages_text(
+            str(file_path), engine=engine, spill_to_disk=True, spill_dir=str(tmp_path)
+        )
+    assert not _leftover_page_stores(tmp_path)
+    assert "Error reading the PDF file" in caplog.text
+
+
+def test_low_memory_empty_file(tmp_path):
+    """Test that low_memory mode rejects an empty file like the default mode"""
+    if "pypdf2" not in available_engines():
+        pytest.skip("PyPDF2 is not installed")
+    file_path = tmp_path / "empty.pdf"
+    file_path.touch()
+    with pytest.raises(Exception) as default_error:
+        extract_pages_text(str(file_path), engine="pypdf2")
+    with pytest.raises(Exception) as low_memory_error:
+        extract_pages_text(
+            str(file_path),
+            engine="pypdf2",
+            low_memory=True,
+            spill_to_disk=True,
+            spill_dir=str(tmp_path),
+        )
+    assert low_memory_error.type is default_error.type
+    assert not _leftover_page_stores(tmp_path)
@@ -0,0 +1,113 @@
+"""Module with unit tests for the semantic chat response cache."""
+
+import zlib
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from genaipy.openai_apis import semantic_cache  # pylint: disable=wrong-import-position
+from genaipy.openai_apis.semantic_cache import (  # pylint: disable=wrong-import-position
+    SemanticCache,
+)
+
+
+def fake_embed(texts):
+    """Embeds texts as normalized bag-of-words count vectors"""
+    vectors = []
+    for text in texts:
+        vector = np.zeros(64)
+        for word in text.lower().replace("?", "").split():
+            vector[zlib.crc32(word.encode()) % 64] += 1
+        vectors.append(vector.tolist())
+    return vectors
+
+
+@pytest.fixture
+def responses(monkeypatch):
+    """Records the prompts sent to the Chat API and answers with a numbered reply"""
+    prompts = []
+
+    def fake_get_chat_response(prompt, **kwargs):  # pylint: disable=unused-argument
+        prompts.append(prompt)
+        return f"answer {len(prompts)}"
+
+    monkeypatch.setattr(semantic_cache, "get_chat_response", fake_get_chat_response)
+    return prompts
+
+
+# Unit tests
+def test_whitespace_variant_hits_exact(responses):
+    """Test that prompts differing only in whitespace are answered from the cache"""
+    cache = SemanticCache(embed_fn=fake_embed)
+    first = cache.get_chat_response("What is  the AI Act?\n")
+    second = cache.get_chat_response("What is the AI Act?")
+    assert first == second == "answer 1"
+    assert len(responses) == 1
+    assert cache.hits == 1
+
+
+def test_similar_prompt_hits(responses):
+    """Test that a rephrased prompt above the threshold is answered from the cache"""
+    cache = SemanticCache(embed_fn=fake_embed, threshold=0.8)
+    cache.get_chat_response("what are the obligations of providers under the act")
+    result = cache.get_chat_response(
+        "what are the obligations for providers under the act"
+    )
+    assert result == "answer 1"
+    assert len(responses) == 1
+
+
+def test_template_threshold(responses):
+    """Test that a per-template threshold overrides the default threshold"""
+    cache = SemanticCache(embed_fn=fake_embed, threshold=0.8, thresholds={"qa": 0.999})
+    cache.get_chat_response("what are the obligations of providers", template="qa")
+    cache.get_chat_response("what are the obligations for providers", template="qa")
+    assert len(responses) == 2
+
+
+def test_namespaces_are_separate(responses):
+    """Test that the same prompt with another model is not answered from the cache"""
+    cache = SemanticCache(embed_fn=fake_embed)
+    cache.get_chat_response("Summarize the act", model="model-a")
+    cache.get_chat_response("Summarize the act", model="model-b")
+    assert len(responses) == 2
+
+
+def test_lru_eviction(responses):  # pylint: disable=unused-argument
+    """Test that the least recently used entry is evicted when the cache is full"""
+    cache = SemanticCache(embed_fn=fake_embed, max_entries=2)
+    cache.store("alpha beta gamma", "first")
+    cache.store("delta epsilon zeta", "second")
+    assert cache.lookup("alpha beta gamma") == "first"
+    cache.store("eta theta iota", "third")
+    assert len(cache) == 2
+    assert cache.lookup("delta epsilon zeta") is None
+    assert cache.lookup("alpha beta gamma") == "first"
+
+
+def test_ann_search_per_namespace(responses):  # pylint: disable=unused-argument
+    """Test that ANN lookups are not crowded out by entries of other namespaces"""
+    pytest.importorskip("hnswlib")
+    caches = [
+        SemanticCache(embed_fn=fake_embed, threshold=0.5, use_ann=use_ann)
+        for use_ann in (False, True)
+    ]
+    for cache in caches:
+        for idx in range(50):
+            cache.store(f"bb bb word{idx}", f"other {idx}", namespace="other")
+        cache.store("bb", "B", namespace="mine")
+        assert cache.lookup("bb bb", namespace="mine") == "B"
+        assert cache.lookup("bb bb", namespace="unknown") is None
+
+
+def test_ann_eviction_across_namespaces(responses):  # pylint: disable=unused-argument
+    """Test that ANN lookups stay consistent when evicted slots change namespace"""
+    pytest.importorskip("hnswlib")
+    cache = SemanticCache(embed_fn=fake_embed, max_entries=3, use_ann=True)
+    words = "one two three four five six seven eight nine ten".split()
+    for idx, word in enumerate(words):
+        cache.store(f"alpha beta {word}", word, namespace=str(idx % 2))
+    assert len(cache) == 3
+    assert cache.lookup("alpha beta  ten", namespace="1") == "ten"
+    assert cache.lookup("alpha   beta nine", namespace="0") == "nine"
+    assert cache.lookup("alpha beta two", namespace="1") is None
@@ -0,0 +1,85 @@
+"""Module with unit tests for the per-stage timing traces."""
+
+import json
+import threading
+import time
+import pytest
+
+from genaipy.prompts.build_prompt import build_prompt
+from genaipy.utilities import tracing
+
+
+@pytest.fixture(autouse=True)
+def clean_tracing():
+    """Starts every test with tracing disabled and no recorded spans"""
+    tracing.enable_tracing(False)
+    tracing.reset_tracing()
+    yield
+    tracing.enable_tracing(False)
+    tracing.reset_tracing()
+
+
+# Unit tests
+def test_disabled_records_nothing():
+    """Test that no spans are recorded while tracing is disabled"""
+    with tracing.span("block"):
+        pass
+    build_prompt("{text}", text="hello")
+    assert not tracing.get_stage_summary()
+
+
+def test_span_and_traced_record_stages():
+    """Test that spans and decorated functions are aggregated per stage"""
+    tracing.enable_tracing()
+
+    @tracing.traced()
+    def sleepy():
+        time.sleep(0.01)
+
+    with tracing.span("outer"):
+        sleepy()
+        sleepy()
+    assert build_prompt("{text}", text="hello") == "hello"
+
+    summary = tracing.get_stage_summary()
+    assert list(summary) == ["outer", "sleepy", "build_prompt"]
+    assert summary["sleepy"]["count"] == 2
+    assert summary["sleepy"]["total"] >= 0.02
+    assert summary["outer"]["total"] >= summary["sleepy"]["total"]
+    assert "sleepy" in tracing.format_stage_summary()
+
+
+def test_traced_records_failing_calls():
+    """Test that a call raising an exception is still recorded"""
+    tracing.enable_tracing()
+
+    @tracing.traced("failing")
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        failing()
+    assert tracing.get_stage_summary()["failing"]["count"] == 1
+
+
+def test_write_chrome_trace(tmp_path):
+    """Test that spans from several threads are written as Chrome trace events"""
+    tracing.enable_tracing()
+
+    def work():
+        with tracing.span("work"):
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    trace_path = tmp_path / "trace.json"
+    tracing.write_chrome_trace(str(trace_path))
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    assert len(events) == 3
+    assert {event["ph"] for event in events} == {"X"}
+    assert len({event["tid"] for event in events}) == 3
+    assert all(event["dur"] >= 1000 for event in events)
@@ -0,0 +1,96 @@
+"""Module with unit tests for the web digest pipeline."""
+
+import json
+import pytest
+
+pytest.importorskip("bs4")
+
+from genaipy.pipelines import web_digest  # pylint: disable=wrong-import-position
+
+PAGES = {
+    f"https://example.com/article-{idx}": (
+        f"<html><body><h1>Article {idx}</h1><p>Body of article {idx}.</p></body></html>"
+    ).encode("utf-8")
+    for idx in range(20)
+}
+
+
+@pytest.fixture
+def fake_web(monkeypatch):
+    """Serves pages from memory and records the prompts sent to the Chat API"""
+    prompts = []
+
+    def fake_fetch_html(url):
+        if url not in PAGES:
+            raise ValueError(f"Unknown URL {url}")
+        return PAGES[url]
+
+    def fake_get_chat_response(prompt, **kwargs):  # pylint: disable=unused-argument
+        prompts.append(prompt)
+        return "# Summary"
+
+    monkeypatch.setattr(web_digest, "fetch_html", fake_fetch_html)
+    monkeypatch.setattr(web_digest, "get_chat_response", fake_get_chat_response)
+    return prompts
+
+
+# Unit tests
+def test_summarize_all_urls(fake_web, tmp_path):
+    """Test that every URL is summarized and written to the output folder"""
+    summaries = web_digest.summarize_urls(
+        PAGES, output_dir=str(tmp_path), fetch_workers=3, chat_workers=2, queue_size=2
+    )
+    assert set(summaries) == set(PAGES)
+    assert len(fake_web) == len(PAGES)
+    assert len(list(tmp_path.iterdir())) == len(PAGES)
+    assert any("Body of article 7" in prompt for prompt in fake_web)
+
+
+def test_skip_unchanged_pages(fake_web, tmp_path, monkeypatch):
+    """Test that pages with unchanged content are skipped on the next run"""
+    state_path = str(tmp_path / "state.json")
+    web_digest.summarize_urls(PAGES, state_path=state_path)
+    changed_url = "https://example.com/article-3"
+    monkeypatch.setitem(PAGES, changed_url, b"<html><h1>Updated</h1></html>")
+
+    summaries = web_digest.summarize_urls(PAGES, state_path=state_path)
+    assert list(summaries) == [changed_url]
+    assert len(fake_web) == len(PAGES) + 1
+
+
+def test_failing_url_does_not_stop_pipeline(fake_web):
+    """Test that a failing URL is skipped while the remaining URLs are summarized"""
+    urls = ["https://example.com/missing"] + list(PAGES)
+    summaries = web_digest.summarize_urls(urls)
+    assert set(summaries) == set(PAGES)
+
+
+def test_changed_settings_resummarize(fake_web, tmp_path):
+    """Test that changing the outline or model summarizes unchanged pages again"""
+    state_path = str(tmp_path / "state.json")
+    web_digest.summarize_urls(PAGES, state_path=state_path)
+    assert not web_digest.summarize_urls(PAGES, state_path=state_path)
+
+    summaries = web_digest.summarize_urls(
+        PAGES, outline="# Key points\n{text}", state_path=state_path
+    )
+    assert set(summaries) == set(PAGES)
+    summaries = web_digest.summarize_urls(PAGES, model="gpt-4", state_path=state_path)
+    assert set(summaries) == set(PAGES)
+    assert len(fake_web) == 3 * len(PAGES)
+
+
+def test_state_saved_per_page(fake_web, tmp_path, monkeypatch):
+    """Test that the state is saved after every summarized page"""
+    state_path = tmp_path / "state.json"
+    saved_counts = []
+
+    def fake_get_chat_response(prompt, **kwargs):  # pylint: disable=unused-argument
+        fake_web.append(prompt)
+        if state_path.exists():
+            saved_counts.append(len(json.loads(state_path.read_text("utf-8"))))
+        return "# Summary"
+
+    monkeypatch.setattr(web_digest, "get_chat_response", fake_get_chat_response)
+    web_digest.summarize_urls(PAGES, state_path=str(state_path), chat_workers=1)
+    assert saved_counts == list(range(1, len(PAGES)))